@@ -0,0 +1,52 @@
+"""Throughput of ChicagoStyler.title_case (one styler per title) against
+ChicagoStyler.title_case_batch (one tagging pass, vectorized rules).
+
+    python benchmarks/bench_batch.py --n 5000
+"""
+
+import argparse
+import itertools
+import time
+
+from title_caser import ChicagoStyler
+
+TITLES = [
+    "Corporate distress diagnosis: Comparisons using linear discriminant analysis"
+    " and neural networks (the Italian experience)",
+    "How Much do Bank Shocks AfFect Investment? evidence from Matched Bank-Firm Loan"
+    " Data",
+    "Under-the-Counter Transactions and Out-of-Fashion Initiatives",
+    "Record-Breaking Borrowings from Medium-Sized Libraries",
+    "a history of the chicago lying-in hospital",
+    "empirical investment equations: an integrative framework",
+    "the effect of the ppp on small business employment in the usa",
+    "insert knob a in hole b",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=2000, help="number of titles")
+    args = parser.parse_args()
+
+    titles = list(itertools.islice(itertools.cycle(TITLES), args.n))
+    ChicagoStyler(TITLES[0]).title_case()  # load the model outside the timings
+
+    start = time.perf_counter()
+    loop = [ChicagoStyler(title).title_case() for title in titles]
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = ChicagoStyler().title_case_batch(titles)
+    batch_time = time.perf_counter() - start
+
+    assert loop == batch
+
+    print(f"titles: {args.n}")
+    print(f"per-object loop: {loop_time:.3f}s ({args.n / loop_time:,.0f} titles/s)")
+    print(f"batch:           {batch_time:.3f}s ({args.n / batch_time:,.0f} titles/s)")
+    print(f"speedup:         {loop_time / batch_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Character classification: the per-character Python loops and string.punctuation
+checks the styler used before, against the charclass helpers, for pure ASCII words
+and for words with curly quotes, dashes and non-Latin letters.
+
+    python benchmarks/bench_charclass.py
+"""
+
+import string
+import timeit
+
+from title_caser import Styler
+from title_caser.charclass import (
+    _build_unicode_tables,
+    rstrip_punctuation,
+    strip_punctuation,
+)
+
+ASCII_WORDS = ["(the", "investment", "k&r", "cdcs,", "framework:", "(cbp)", "spy"]
+UNICODE_WORDS = ["“the", "investición", "‘k&r’", "cdcs”,", "рамка:", "«cbp»", "—"]
+
+
+def capitalize_loop(word: str) -> str:
+    word_lst = []
+    first = True
+    for c in word:
+        if c not in string.punctuation and first:
+            c = c.upper()
+            first = False
+
+        word_lst.append(c)
+
+    return "".join(word_lst)
+
+
+def strip_loop(word: str) -> str:
+    return word.translate(word.maketrans("", "", string.punctuation))
+
+
+def has_no_vowels_loop(word: str) -> bool:
+    return all(char not in "aeiouy" for char in word)
+
+
+CASES = {
+    "capitalize": (capitalize_loop, Styler.capitalize),
+    "strip punctuation": (strip_loop, strip_punctuation),
+    "rstrip punctuation": (
+        lambda w: w.rstrip(string.punctuation),
+        rstrip_punctuation,
+    ),
+    "has_no_vowels": (has_no_vowels_loop, Styler.has_no_vowels),
+}
+
+
+def per_word_ns(func, words: list[str], number: int) -> float:
+    seconds = timeit.timeit(lambda: [func(w) for w in words], number=number)
+
+    return 1e9 * seconds / (number * len(words))
+
+
+def main():
+    number = 20_000
+    build = timeit.timeit(_build_unicode_tables, number=1)
+    print(f"unicode tables built at import in {build * 1e3:.0f}ms\n")
+
+    print(f"{'':<20} {'ascii before':>13} {'ascii after':>12} {'unicode after':>14}")
+    for name, (before, after) in CASES.items():
+        print(
+            f"{name:<20} {per_word_ns(before, ASCII_WORDS, number):>11.0f}ns"
+            f" {per_word_ns(after, ASCII_WORDS, number):>10.0f}ns"
+            f" {per_word_ns(after, UNICODE_WORDS, number):>12.0f}ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
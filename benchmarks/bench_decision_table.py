@@ -0,0 +1,109 @@
+"""Decision table hit rate and speedup of ChicagoStyler.title_case over running the
+full rule chain for every word. Tagging, including the elements of hyphenated
+words, is done up front and not timed.
+
+The titles must be distinct, since a word is only admitted to the table on its
+third lookup and repeated titles would inflate the hit rate. By default the
+titles in titles.txt next to this script are used. The first pass, over distinct
+titles with an empty table, gives the realistic hit rate. The titles are then
+cased again until no more words are admitted, and the last pass shows the speed
+of a table that holds this vocabulary.
+
+    python benchmarks/bench_decision_table.py --titles titles.txt
+"""
+
+import argparse
+import pathlib
+import time
+
+from title_caser import ChicagoStyler, clear_decision_tables
+
+# Distinct paper and book titles, mostly economics and finance, in sentence case
+CORPUS = pathlib.Path(__file__).with_name("titles.txt")
+
+
+def full_chain(styler: ChicagoStyler) -> str:
+    hyphen_corrections, _ = styler._hyphen_corrections(
+        [w.word for w in styler._tagged_words if w.is_hyphenated], None
+    )
+
+    return " ".join(
+        styler._case_word(word_info, hyphen_corrections)
+        for word_info in styler._tagged_words
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--titles", default=CORPUS, help="file with one distinct title per line"
+    )
+    parser.add_argument("--n", type=int, help="number of titles (default: all)")
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="report the best of this many runs"
+    )
+    args = parser.parse_args()
+
+    with open(args.titles, encoding="utf-8") as f:
+        titles = [title for title in f.read().splitlines() if title][: args.n]
+    if len(set(titles)) != len(titles):
+        parser.error(f"{args.titles} has repeated titles")
+
+    stylers = [ChicagoStyler(title) for title in titles]
+    # Hyphenated words are tagged by the model inside title_case. Do that once up
+    # front so only the rule loop is timed.
+    for styler in stylers:
+        hyphen_corrections = styler._hyphen_corrections(
+            [w.word for w in styler._tagged_words if w.is_hyphenated], None
+        )
+        styler._hyphen_corrections = lambda *_, hc=hyphen_corrections: hc
+
+    chain_time = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        expected = [full_chain(styler) for styler in stylers]
+        chain_time = min(chain_time, time.perf_counter() - start)
+
+    # Each repeat starts from an empty table. Building it from the lexicon is timed
+    # on its own, since it happens once per configuration.
+    build_time = cold_time = warm_time = float("inf")
+    for _ in range(args.repeat):
+        clear_decision_tables()
+        start = time.perf_counter()
+        table = ChicagoStyler().decision_table
+        build_time = min(build_time, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        cold = [styler.title_case() for styler in stylers]
+        cold_time = min(cold_time, time.perf_counter() - start)
+        cold_hit_rate = table.hit_rate
+
+        admitted = None
+        while admitted != table.admitted:
+            admitted = table.admitted
+            table.hits = table.misses = 0
+            start = time.perf_counter()
+            warm = [styler.title_case() for styler in stylers]
+        warm_time = min(warm_time, time.perf_counter() - start)
+
+        assert expected == cold == warm
+
+    words = sum(len(styler._tagged_words) for styler in stylers)
+    print(
+        f"titles: {len(titles):,}, words: {words:,}, admitted: {table.admitted:,},"
+        f" words in table: {len(table.decisions):,}"
+    )
+    print(f"table build:       {build_time:.3f}s")
+    print(f"full chain:        {chain_time:.3f}s")
+    print(
+        f"table, first pass: {cold_time:.3f}s ({chain_time / cold_time:.2f}x,"
+        f" hit rate {cold_hit_rate:.1%})"
+    )
+    print(
+        f"table, settled:    {warm_time:.3f}s ({chain_time / warm_time:.2f}x,"
+        f" hit rate {table.hit_rate:.1%})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Time tag_words and title_case on titles of 10, 100, 1k and 10k words to check
+that both scale linearly in the number of words.
+
+    python benchmarks/bench_scaling.py
+"""
+
+import argparse
+import itertools
+import time
+
+from title_caser import ChicagoStyler, Overflow
+
+WORDS = (
+    "empirical investment equations: an integrative framework for the fbi and"
+    " medium-sized libraries (cbp) of new york"
+).split(" ")
+
+SIZES = (10, 100, 1_000, 10_000)
+
+
+def make_title(n_tokens: int) -> str:
+    return " ".join(itertools.islice(itertools.cycle(WORDS), n_tokens))
+
+
+def best_of(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--max-tokens",
+        type=int,
+        default=None,
+        help="run with max_tokens and the chunk overflow policy",
+    )
+    args = parser.parse_args()
+
+    kwargs = {}
+    if args.max_tokens is not None:
+        kwargs = {"max_tokens": args.max_tokens, "overflow": Overflow.CHUNK}
+
+    styler = ChicagoStyler(make_title(10), **kwargs)  # load the model up front
+
+    print(f"{'tokens':>8} {'tag_words':>12} {'title_case':>12} {'us/token':>10}")
+    per_token = []
+    for n_tokens in SIZES:
+        title = make_title(n_tokens)
+        words = styler._clean(title)
+
+        tag_time = best_of(lambda: styler.tag_words(words), args.repeat)
+        case_time = best_of(
+            lambda: ChicagoStyler(title, **kwargs).title_case(), args.repeat
+        )
+        per_token.append(case_time / n_tokens)
+        print(
+            f"{n_tokens:>8} {tag_time:>11.4f}s {case_time:>11.4f}s"
+            f" {1e6 * per_token[-1]:>10.1f}"
+        )
+
+    # With linear scaling the cost per token stays flat (small inputs are dominated
+    # by fixed overhead, so compare the two largest sizes)
+    print(f"per-token cost ratio 10k/1k: {per_token[-1] / per_token[-2]:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Time-to-first-title and peak RSS in a fresh interpreter: a cold spacy.load of
+the full pipeline against restoring a snapshot written by save_snapshot.
+
+    python benchmarks/bench_startup.py --model en_core_web_lg --repeat 5
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import tempfile
+
+TITLE = "corporate distress diagnosis: an integrative framework"
+
+COLD = f"""
+import resource, time
+start = time.perf_counter()
+from title_caser import ChicagoStyler
+ChicagoStyler({TITLE!r}, model={{model!r}}).title_case()
+print(time.perf_counter() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+SNAPSHOT = f"""
+import resource, time
+start = time.perf_counter()
+from title_caser.snapshot import load_snapshot
+load_snapshot({{path!r}}).styler({TITLE!r}).title_case()
+print(time.perf_counter() - start, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+SAVE = """
+from title_caser.snapshot import save_snapshot
+save_snapshot({path!r}, model={model!r})
+"""
+
+
+def run_fresh_process(code: str, repeat: int) -> list[tuple[float, float]]:
+    """Seconds to the first title and peak RSS in MiB (ru_maxrss is in KiB)."""
+    results = []
+    for _ in range(repeat):
+        seconds, maxrss = subprocess.check_output(
+            [sys.executable, "-c", code], text=True
+        ).split()
+        results.append((float(seconds), int(maxrss) / 1024))
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model", default="en_core_web_lg")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = f"{tmp}/styler.snapshot"
+        # Save from another process, since children inherit the peak RSS of the
+        # process they are forked from
+        subprocess.check_call(
+            [sys.executable, "-c", SAVE.format(path=path, model=args.model)]
+        )
+
+        results = {
+            "cold spacy.load": run_fresh_process(
+                COLD.format(model=args.model), args.repeat
+            ),
+            "snapshot restore": run_fresh_process(
+                SNAPSHOT.format(path=path), args.repeat
+            ),
+        }
+
+    for name, runs in results.items():
+        times = [seconds for seconds, _ in runs]
+        print(
+            f"{name:<18} median {statistics.median(times):.3f}s"
+            f"  min {min(times):.3f}s  max {max(times):.3f}s"
+            f"  peak rss {max(rss for _, rss in runs):,.0f}MiB"
+        )
+
+    cold, snapshot = (
+        statistics.median(seconds for seconds, _ in runs) for runs in results.values()
+    )
+    print(f"speedup: {cold / snapshot:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Compare the spaCy and NLTK perceptron tagger backends on the test titles:
+load time and memory, tagging throughput, agreement on the tags the stylers use,
+and how many titles each gets exactly right. The lexicon tagger (the deadline
+fallback) is included as a baseline. Backends whose model or data is not installed
+are skipped.
+
+    python benchmarks/bench_taggers.py --model en_core_web_lg
+"""
+
+import argparse
+import gc
+import pathlib
+import resource
+import sys
+import time
+import tracemalloc
+
+from title_caser import (
+    ChicagoStyler,
+    LexiconTagger,
+    NLTKTagger,
+    SpacyModel,
+    SpacyTagger,
+)
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1] / "tests"))
+
+from test_hyphen_logic import TITLES  # noqa: E402
+from test_title_caser import TITLE1, TITLE2  # noqa: E402
+
+# (input, expected) pairs from the test suite
+CASES = [(title, title) for title in TITLES] + [
+    (
+        TITLE1,
+        "Corporate Distress Diagnosis: Comparisons Using Linear Discriminant"
+        " Analysis and Neural Networks (The Italian Experience)",
+    ),
+    (TITLE2, None),
+    ("twenty-first f-sharp", "Twenty-First F-sharp"),
+    ("Insert Knob A in Hole B", "Insert Knob A in Hole B"),
+]
+
+
+def consulted(tag: str) -> str:
+    """Collapse a tag to what the stylers can tell apart."""
+    if tag in {"NNP", "NNPS"}:
+        return "proper"
+
+    return tag if tag in {"CC", "IN"} else ""
+
+
+def load(factory):
+    gc.collect()
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    start = time.perf_counter()
+    tagger = factory()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return tagger, elapsed, peak, (rss_after - rss_before) * 1024
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--model", type=SpacyModel, default=SpacyModel.LG)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    # Load the small backends first so the spaCy model does not inflate their peak
+    # RSS
+    backends = {}
+    for name, factory in (
+        ("lexicon", LexiconTagger),
+        ("nltk", NLTKTagger),
+        (f"spacy ({args.model})", lambda: SpacyTagger(args.model)),
+    ):
+        try:
+            backends[name] = load(factory)
+        except (ImportError, LookupError, OSError) as e:
+            print(f"skipping {name}: model or data not installed ({type(e).__name__})")
+
+    texts = [ChicagoStyler._clean(title) for title, _ in CASES]
+    tagged = {}
+    print(
+        f"{'backend':<26} {'load':>8} {'py heap':>10} {'max rss +':>10}"
+        f" {'titles/s':>10} {'correct':>8}"
+    )
+    for name, (tagger, load_time, peak, rss) in backends.items():
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            tagged[name] = tagger.tag(texts)
+        throughput = args.repeat * len(texts) / (time.perf_counter() - start)
+
+        expected_cases = [(t, e) for t, e in CASES if e is not None]
+        correct = sum(
+            ChicagoStyler(title, tagger=tagger).title_case() == expected
+            for title, expected in expected_cases
+        )
+        print(
+            f"{name:<26} {load_time:>7.2f}s {peak / 2**20:>8.1f}MB"
+            f" {rss / 2**20:>8.1f}MB {throughput:>10,.0f}"
+            f" {correct:>4}/{len(expected_cases)}"
+        )
+
+    # Agreement with the largest backend that loaded, on the tags the stylers use
+    reference = list(tagged)[-1]
+    for name in list(tagged)[:-1]:
+        pairs = [
+            (consulted(a), consulted(b))
+            for title, reference_title in zip(tagged[name], tagged[reference])
+            for (_, a), (_, b) in zip(title, reference_title)
+        ]
+        agreement = sum(a == b for a, b in pairs) / len(pairs)
+        print(
+            f"{name} agrees with {reference} on consulted tags (CC/IN/proper/other):"
+            f" {agreement:.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
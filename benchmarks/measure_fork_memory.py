@@ -0,0 +1,128 @@
+"""Per-worker memory of forked workers, with and without preloading the model in
+the parent. Each worker cases a batch of titles and runs a full garbage collection
+(as a long-lived worker eventually would), then reports its USS (memory only it
+uses) and PSS (its proportional share of shared memory) from
+/proc/self/smaps_rollup. Linux only.
+
+    python benchmarks/measure_fork_memory.py --workers 4
+"""
+
+import argparse
+import gc
+import json
+import os
+
+from title_caser import ChicagoStyler
+from title_caser.prefork import preload
+
+TITLES = [
+    "corporate distress diagnosis: comparisons using linear discriminant analysis",
+    "record-breaking borrowings from medium-sized libraries",
+    "how much do bank shocks affect investment? evidence from matched loan data",
+] * 100
+
+MODES = ("lazy", "preload", "preload+freeze")
+
+
+def memory() -> dict[str, int]:
+    """USS and PSS in bytes."""
+    fields = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1]) * 1024
+
+    return {
+        "uss": fields["Private_Clean"] + fields["Private_Dirty"],
+        "pss": fields["Pss"],
+    }
+
+
+def wait_for_close(read_fd: int) -> None:
+    """Block until every process holding the write end of the pipe has closed it."""
+    while os.read(read_fd, 1):
+        pass
+
+
+def worker(write_fd: int, measure_fd: int, exit_fd: int) -> None:
+    ChicagoStyler().title_case_batch(TITLES)
+    gc.collect()
+
+    # Measure only once every worker is done casing, and stay alive until every
+    # measurement has been collected, so all workers see the same sharing
+    os.write(write_fd, b"\n")
+    wait_for_close(measure_fd)
+    with os.fdopen(write_fd, "w") as f:
+        json.dump(memory(), f)
+    wait_for_close(exit_fd)
+
+
+def run(mode: str, n_workers: int) -> list[dict[str, int]]:
+    # Each mode runs in its own child so the parent's state does not leak between
+    # modes
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        if mode != "lazy":
+            preload(freeze=mode == "preload+freeze")
+
+        # Workers wait for the parent to close the write ends of these pipes
+        measure_r, measure_w = os.pipe()
+        exit_r, exit_w = os.pipe()
+
+        pipes, pids = [], []
+        for _ in range(n_workers):
+            r, w = os.pipe()
+            child = os.fork()
+            if child == 0:
+                os.close(r)
+                os.close(measure_w)
+                os.close(exit_w)
+                worker(w, measure_r, exit_r)
+                os._exit(0)
+            os.close(w)
+            pipes.append(r)
+            pids.append(child)
+
+        for r in pipes:
+            os.read(r, 1)  # done casing
+        os.close(measure_w)
+
+        results = []
+        for r in pipes:
+            with os.fdopen(r) as f:
+                results.append(json.load(f))
+
+        os.close(exit_w)
+        for child in pids:
+            os.waitpid(child, 0)
+
+        with os.fdopen(write_fd, "w") as f:
+            json.dump(results, f)
+        os._exit(0)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd) as f:
+        results = json.load(f)
+    os.waitpid(pid, 0)
+
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    print(f"{'mode':<16} {'USS/worker':>12} {'PSS/worker':>12}")
+    for mode in MODES:
+        results = run(mode, args.workers)
+        uss = sum(r["uss"] for r in results) / len(results)
+        pss = sum(r["pss"] for r in results) / len(results)
+        print(f"{mode:<16} {uss / 2**20:>10.1f}MB {pss / 2**20:>10.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,3 @@
 from .styler import *  # noqa: F401, F403
+from .taggers import *  # noqa: F401, F403
+from .taggers import __getattr__  # noqa: F401  # deprecated DEFAULT_SPACY_MODEL
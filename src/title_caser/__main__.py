@@ -0,0 +1,135 @@
+# Imports
+
+import argparse
+from typing import Any
+
+from .bulk import DEFAULT_SHARD_SIZE, print_progress, run_bulk_job
+from .hardcoded_words import ACRONYMS
+from .profiling import ProfileMode, profile_titles
+from .styler import Overflow
+from .taggers import DEFAULT_MODEL, LexiconTagger, NLTKTagger, SpacyModel
+
+# Functions
+
+
+def _bulk(args: argparse.Namespace) -> None:
+    result = run_bulk_job(
+        args.input,
+        args.output,
+        workdir=args.workdir,
+        workers=args.workers,
+        shard_size=args.shard_size,
+        batch_size=args.batch_size,
+        progress=print_progress,
+        **_styler_kwargs(args),
+    )
+    rejected = f", {len(result.rejected):,} rejected" if result.rejected else ""
+    print(f"wrote {result.lines:,} titles to {args.output}{rejected}")
+
+
+def _styler_kwargs(args: argparse.Namespace) -> dict[str, Any]:
+    kwargs: dict[str, Any] = {
+        "model": args.model,
+        "deadline": args.deadline,
+        "max_chars": args.max_chars,
+        "max_tokens": args.max_tokens,
+        "overflow": args.overflow,
+    }
+    if args.tagger == "nltk":
+        kwargs["tagger"] = NLTKTagger()
+    elif args.tagger == "lexicon":
+        kwargs["tagger"] = LexiconTagger()
+
+    if args.acronyms is not None:
+        with open(args.acronyms, encoding="utf-8") as f:
+            kwargs["acronyms"] = ACRONYMS | {
+                line.strip().lower() for line in f if line.strip()
+            }
+
+    return kwargs
+
+
+def _profile(args: argparse.Namespace) -> None:
+    with open(args.input, encoding="utf-8") as f:
+        titles = f.read().splitlines()
+
+    report = profile_titles(
+        titles,
+        mode=args.mode,
+        interval=args.interval,
+        **_styler_kwargs(args),
+    )
+    print(report.format(limit=args.limit))
+
+    if args.collapsed is not None:
+        report.write_collapsed(args.collapsed)
+
+
+def _add_styler_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--tagger", choices=["spacy", "nltk", "lexicon"], default="spacy"
+    )
+    parser.add_argument(
+        "--model",
+        type=SpacyModel,
+        choices=list(SpacyModel),
+        default=DEFAULT_MODEL,
+        help="spaCy model for the spacy tagger",
+    )
+    parser.add_argument("--acronyms", help="file with extra acronyms, one per line")
+    parser.add_argument(
+        "--deadline", type=float, help="latency budget per title in seconds"
+    )
+    parser.add_argument("--max-chars", type=int)
+    parser.add_argument("--max-tokens", type=int)
+    parser.add_argument(
+        "--overflow", type=Overflow, choices=list(Overflow), default="truncate"
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(prog="title_caser")
+    subparsers = parser.add_subparsers(required=True)
+
+    bulk = subparsers.add_parser(
+        "bulk",
+        help="title case a file with one title per line, resuming interrupted runs",
+    )
+    bulk.add_argument("input")
+    bulk.add_argument("output")
+    bulk.add_argument(
+        "--workdir", help="shard outputs and manifest (default: OUTPUT.parts)"
+    )
+    bulk.add_argument("--workers", type=int, help="worker processes (default: CPUs)")
+    bulk.add_argument(
+        "--shard-size", type=int, default=DEFAULT_SHARD_SIZE, help="bytes per shard"
+    )
+    bulk.add_argument("--batch-size", type=int, default=1024)
+    _add_styler_arguments(bulk)
+    bulk.set_defaults(func=_bulk)
+
+    profile = subparsers.add_parser(
+        "profile",
+        help="title case a file with one title per line under a profiler and report"
+        " the hotspots",
+    )
+    profile.add_argument("input")
+    profile.add_argument(
+        "--mode", type=ProfileMode, choices=list(ProfileMode), default="sampling"
+    )
+    profile.add_argument(
+        "--interval", type=float, default=0.005, help="seconds between samples"
+    )
+    profile.add_argument("--limit", type=int, default=25, help="hotspots to show")
+    profile.add_argument(
+        "--collapsed", help="write flamegraph-compatible collapsed stacks here"
+    )
+    _add_styler_arguments(profile)
+    profile.set_defaults(func=_profile)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,431 @@
+# Imports
+
+import concurrent.futures
+import dataclasses
+import enum
+import hashlib
+import itertools
+import json
+import mmap
+import os
+import pathlib
+import shutil
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+from .styler import ChicagoStyler, TitleTooLongError
+
+# Globals
+
+DEFAULT_SHARD_SIZE = 64 * 2**20  # bytes
+MANIFEST_NAME = "manifest.json"
+
+# Types
+
+
+@dataclasses.dataclass
+class Shard:
+    """Byte range ``[start, end)`` of the input file. Shards always start at the
+    beginning of a line and end right after a newline (or at the end of the file).
+    ``rejected`` holds the input byte offsets of the lines that were not valid UTF-8,
+    or over the limits with the reject overflow policy.
+    """
+
+    index: int
+    start: int
+    end: int
+    done: bool = False
+    lines: int = 0
+    rejected: list[int] = dataclasses.field(default_factory=list)
+
+    @property
+    def filename(self) -> str:
+        return f"shard-{self.index:05d}.txt"
+
+
+@dataclasses.dataclass
+class BulkProgress:
+    shards_done: int
+    shards_total: int
+    lines: int
+    lines_this_run: int
+    bytes_done: int
+    bytes_total: int
+    elapsed: float
+    rejected: list[int] = dataclasses.field(default_factory=list)
+
+    @property
+    def lines_per_second(self) -> float:
+        # Shards finished by an earlier, interrupted run do not count here
+        return self.lines_this_run / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        rejected = f", {len(self.rejected):,} rejected" if self.rejected else ""
+
+        return (
+            f"{self.shards_done}/{self.shards_total} shards,"
+            f" {self.bytes_done / max(self.bytes_total, 1):.1%} of input,"
+            f" {self.lines:,} titles{rejected}, {self.elapsed:.1f}s elapsed"
+            f" ({self.lines_per_second:,.0f} titles/s)"
+        )
+
+
+def plan_shards(path: str | os.PathLike, shard_size: int) -> list[Shard]:
+    """Split a file into byte ranges of roughly ``shard_size`` bytes, moving each
+    boundary forward to just after the next newline so no line is split.
+
+    Args:
+        path (str | os.PathLike): The input file
+        shard_size (int): Target shard size in bytes
+
+    Raises:
+        ValueError: If ``shard_size`` is not positive
+
+    Returns:
+        list[Shard]: The shards, in file order
+    """
+    if shard_size <= 0:
+        raise ValueError(f"shard_size must be positive, got {shard_size}")
+
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+
+    shards = []
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        while start < size:
+            newline = mm.find(b"\n", min(start + shard_size, size) - 1)
+            end = size if newline == -1 else newline + 1
+            shards.append(Shard(index=len(shards), start=start, end=end))
+            start = end
+
+    return shards
+
+
+def _input_fingerprint(path: pathlib.Path) -> dict[str, Any]:
+    stat = path.stat()
+
+    return {"input": str(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _canonical(value: Any) -> Any:
+    """A JSON-serializable form of a styler argument that does not depend on set or
+    dict order. Other objects, like taggers, are represented by their type.
+    """
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value.value if isinstance(value, enum.Enum) else value
+    if isinstance(value, (set, frozenset)):
+        return sorted(_canonical(v) for v in value)
+    if isinstance(value, dict):
+        return sorted([str(k), _canonical(v)] for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return [_canonical(v) for v in value]
+
+    return f"{type(value).__module__}.{type(value).__qualname__}"
+
+
+def _job_config(shard_size: int, styler_kwargs: dict[str, Any]) -> dict[str, Any]:
+    """The settings that change the output of a job, which a resumed run must
+    share with the run that wrote the manifest.
+    """
+    styler = json.dumps(_canonical(styler_kwargs), sort_keys=True)
+
+    return {
+        "shard_size": shard_size,
+        "styler": hashlib.sha256(styler.encode()).hexdigest(),
+    }
+
+
+def _write_atomic(path: pathlib.Path, data: bytes) -> None:
+    """Write to a temporary file next to ``path`` and rename it into place, so a
+    crash never leaves a partially written file under the final name.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(tmp, path)
+
+
+def _write_manifest(
+    workdir: pathlib.Path,
+    fingerprint: dict[str, Any],
+    config: dict[str, Any],
+    shards: list[Shard],
+) -> None:
+    manifest = {
+        **fingerprint,
+        "config": config,
+        "shards": [dataclasses.asdict(s) for s in shards],
+    }
+    _write_atomic(workdir / MANIFEST_NAME, json.dumps(manifest, indent=1).encode())
+
+
+def _read_manifest(
+    workdir: pathlib.Path, fingerprint: dict[str, Any], config: dict[str, Any]
+) -> list[Shard] | None:
+    """Return the shards of a previous run over the same, unchanged input.
+
+    Raises:
+        ValueError: If the previous run used a different shard size or styler
+        arguments, since its finished shards were cased differently
+    """
+    try:
+        manifest = json.loads((workdir / MANIFEST_NAME).read_text())
+    except FileNotFoundError:
+        return None
+
+    if any(manifest.get(k) != v for k, v in fingerprint.items()):
+        return None
+
+    if manifest.get("config") != config:
+        raise ValueError(
+            f"{workdir} holds a run with a different shard_size or styler arguments."
+            " Resume it with the same settings, or remove the directory to start over."
+        )
+
+    shards = [Shard(**s) for s in manifest["shards"]]
+    for shard in shards:
+        # Only trust a finished shard if its output actually made it to disk
+        shard.done = shard.done and (workdir / shard.filename).exists()
+
+    return shards
+
+
+# Worker processes build their styler once and reuse it for every shard
+_STYLER: ChicagoStyler | None = None
+
+
+def _init_worker(styler_kwargs: dict[str, Any]) -> None:
+    global _STYLER
+
+    _STYLER = ChicagoStyler(**styler_kwargs)
+
+
+def _case_batch(titles: list[str]) -> tuple[list[str], list[int]]:
+    """Title case a batch, leaving titles rejected by the overflow policy unchanged.
+    Also returns the indices of the rejected titles.
+    """
+    assert _STYLER is not None
+
+    try:
+        return _STYLER.title_case_batch(titles), []
+    except TitleTooLongError:
+        pass
+
+    rejected = []
+    for idx, title in enumerate(titles):
+        try:
+            _STYLER._limit(_STYLER._clean(title))
+        except TitleTooLongError:
+            rejected.append(idx)
+
+    cased = titles.copy()
+    rejected_set = set(rejected)
+    accepted = [idx for idx in range(len(titles)) if idx not in rejected_set]
+    for idx, title in zip(
+        accepted, _STYLER.title_case_batch([titles[idx] for idx in accepted])
+    ):
+        cased[idx] = title
+
+    return cased, rejected
+
+
+def _is_undecodable(line: str) -> bool:
+    """Tests if a line decoded with surrogateescape held bytes that are not UTF-8."""
+    try:
+        line.encode("utf-8")
+    except UnicodeEncodeError:
+        return True
+
+    return False
+
+
+def _process_shard(
+    input_path: str, workdir: str, shard: Shard, batch_size: int
+) -> tuple[int, int, list[int]]:
+    with open(input_path, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm:
+        # Invalid bytes are kept as lone surrogates, so those lines can be copied to
+        # the output byte for byte
+        text = mm[shard.start : shard.end].decode("utf-8", errors="surrogateescape")
+
+    lines = text.split("\n")
+    if lines[-1] == "":
+        lines.pop()  # the shard ends with a newline
+    titles = [line.removesuffix("\r") for line in lines]
+
+    rejected = [idx for idx, title in enumerate(titles) if _is_undecodable(title)]
+    undecodable = set(rejected)
+    accepted = [idx for idx in range(len(titles)) if idx not in undecodable]
+
+    cased = titles.copy()
+    for i in range(0, len(accepted), batch_size):
+        batch = accepted[i : i + batch_size]
+        batch_cased, batch_rejected = _case_batch([titles[idx] for idx in batch])
+        for idx, title in zip(batch, batch_cased):
+            cased[idx] = title
+        rejected.extend(batch[idx] for idx in batch_rejected)
+
+    data = "".join(title + "\n" for title in cased).encode(
+        "utf-8", errors="surrogateescape"
+    )
+    _write_atomic(pathlib.Path(workdir) / shard.filename, data)
+
+    if rejected:
+        offsets = list(
+            itertools.accumulate(
+                (
+                    len(line.encode("utf-8", errors="surrogateescape")) + 1
+                    for line in lines
+                ),
+                initial=shard.start,
+            )
+        )
+        rejected = [offsets[idx] for idx in sorted(rejected)]
+
+    return shard.index, len(titles), rejected
+
+
+def run_bulk_job(
+    input_path: str | os.PathLike,
+    output_path: str | os.PathLike,
+    workdir: str | os.PathLike | None = None,
+    workers: int | None = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    batch_size: int = 1024,
+    progress: Callable[[BulkProgress], None] | None = None,
+    **styler_kwargs,
+) -> BulkProgress:
+    """Title case every line of a file with ChicagoStyler, in parallel.
+
+    The input is split into shards on line boundaries, and each shard is processed
+    in a worker process and written to its own file in ``workdir``. A manifest in
+    ``workdir`` records the finished shards, so running the same job again after a
+    crash only processes the unfinished ones. Once every shard is done they are
+    concatenated into ``output_path`` and ``workdir`` is removed.
+
+    Args:
+        input_path (str | os.PathLike): File with one title per line
+        output_path (str | os.PathLike): Where to write the cased titles
+        workdir (str | os.PathLike | None, optional): Directory for shard outputs
+        and the manifest. Defaults to None, which is ``<output_path>.parts``.
+        workers (int | None, optional): Number of worker processes. Defaults to
+        None, which is the number of CPUs.
+        shard_size (int, optional): Target shard size in bytes. Defaults to 64 MiB.
+        batch_size (int, optional): Titles per title_case_batch call. Defaults to
+        1024.
+        progress (Callable[[BulkProgress], None] | None, optional): Called after
+        every finished shard. Defaults to None.
+        **styler_kwargs: Passed to ChicagoStyler in each worker, e.g. acronyms or
+        max_tokens. Must be picklable.
+
+    Lines that are not valid UTF-8, and with ``overflow=Overflow.REJECT`` titles
+    over the limits, are copied to the output unchanged instead of failing the job,
+    and their byte offsets in the input are listed in ``BulkProgress.rejected``.
+
+    If a shard fails, the shards not started yet are cancelled, the ones already
+    running are still recorded in the manifest, and the error is raised once they
+    finish, so running the job again only redoes the failed and cancelled shards.
+
+    Raises:
+        ValueError: If ``workdir`` holds an interrupted run of the same input with a
+        different ``shard_size`` or different styler arguments
+
+    Returns:
+        BulkProgress: Totals for the run
+    """
+    input_path = pathlib.Path(input_path).resolve()
+    output_path = pathlib.Path(output_path)
+    if workdir is None:
+        workdir = output_path.with_name(output_path.name + ".parts")
+    workdir = pathlib.Path(workdir)
+    workdir.mkdir(parents=True, exist_ok=True)
+
+    fingerprint = _input_fingerprint(input_path)
+    config = _job_config(shard_size, styler_kwargs)
+    shards = _read_manifest(workdir, fingerprint, config)
+    if shards is None:
+        shards = plan_shards(input_path, shard_size)
+        _write_manifest(workdir, fingerprint, config, shards)
+
+    start_time = time.perf_counter()
+    bytes_total = fingerprint["size"]
+    lines_before = sum(s.lines for s in shards if s.done)
+
+    def report() -> BulkProgress:
+        done = [s for s in shards if s.done]
+        lines = sum(s.lines for s in done)
+
+        return BulkProgress(
+            shards_done=len(done),
+            shards_total=len(shards),
+            lines=lines,
+            lines_this_run=lines - lines_before,
+            bytes_done=sum(s.end - s.start for s in done),
+            bytes_total=bytes_total,
+            elapsed=time.perf_counter() - start_time,
+            rejected=[offset for s in done for offset in s.rejected],
+        )
+
+    pending = [s for s in shards if not s.done]
+    if pending:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(styler_kwargs,),
+        ) as executor:
+            futures = [
+                executor.submit(
+                    _process_shard, str(input_path), str(workdir), shard, batch_size
+                )
+                for shard in pending
+            ]
+            error: Exception | None = None
+            for future in concurrent.futures.as_completed(futures):
+                if future.cancelled():
+                    continue
+
+                try:
+                    index, lines, rejected = future.result()
+                except Exception as e:
+                    if error is None:
+                        error = e
+                        for other in futures:
+                            other.cancel()
+                    continue
+
+                shards[index].done = True
+                shards[index].lines = lines
+                shards[index].rejected = rejected
+                _write_manifest(workdir, fingerprint, config, shards)
+
+                if progress is not None:
+                    progress(report())
+
+            if error is not None:
+                raise error
+
+    tmp = output_path.with_name(output_path.name + ".tmp")
+    with open(tmp, "wb") as out:
+        for shard in shards:
+            with open(workdir / shard.filename, "rb") as f:
+                shutil.copyfileobj(f, out)
+        out.flush()
+        os.fsync(out.fileno())
+    os.replace(tmp, output_path)
+
+    result = report()
+    shutil.rmtree(workdir)
+
+    return result
+
+
+def print_progress(progress: BulkProgress) -> None:
+    print(progress, file=sys.stderr, flush=True)
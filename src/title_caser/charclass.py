@@ -0,0 +1,127 @@
+# Imports
+
+import re
+import string
+import unicodedata
+
+# Globals
+
+ASCII_PUNCTUATION = string.punctuation
+
+# Characters that end a clause, so the next word is capitalized as if it started
+# the title. Besides the ASCII ones this covers en/em dashes, the ellipsis and the
+# full-width and ideographic forms.
+BREAK_CHARACTERS = frozenset(
+    ":?!.-"
+    "–"  # en dash
+    "—"  # em dash
+    "―"  # horizontal bar
+    "…"  # ellipsis
+    "！．：？"  # full-width ! . : ?
+    "。"  # ideographic full stop
+)
+
+# Closing quotes that may follow a clause break, as in “Why?” A Study or
+# "Why?" A Study
+CLOSING_QUOTES = "\"'’”»›"
+
+# Punctuation and symbols are only assigned in the Basic Multilingual Plane and the
+# Supplementary Multilingual Plane, so the tables only need to cover those
+_LAST_PUNCTUATION_PLANE_END = 0x1FFFF
+
+_ASCII_DELETE_PUNCTUATION = str.maketrans("", "", ASCII_PUNCTUATION)
+
+# Functions
+
+
+def _build_unicode_tables() -> tuple[dict[int, None], re.Pattern]:
+    """A translation table deleting every punctuation or symbol code point (general
+    category P* or S*, the Unicode counterpart of string.punctuation), and a regex
+    matching a run of them.
+    """
+    code_points = [
+        cp
+        for cp in range(_LAST_PUNCTUATION_PLANE_END + 1)
+        if unicodedata.category(chr(cp))[0] in "PS"
+    ]
+
+    ranges = []
+    start = prev = code_points[0]
+    for cp in code_points[1:]:
+        if cp != prev + 1:
+            ranges.append((start, prev))
+            start = cp
+        prev = cp
+    ranges.append((start, prev))
+
+    charset = "".join(
+        re.escape(chr(lo)) if lo == hi else f"{re.escape(chr(lo))}-{re.escape(chr(hi))}"
+        for lo, hi in ranges
+    )
+
+    return dict.fromkeys(code_points), re.compile(f"[{charset}]*")
+
+
+# Built at import (in about 20ms) rather than on the first non-ASCII word, so the
+# cost is not paid in the middle of a request and pre-forked workers share them
+_UNICODE_DELETE_PUNCTUATION, _UNICODE_PUNCTUATION_RUN = _build_unicode_tables()
+
+
+def strip_punctuation(word: str) -> str:
+    """Remove all punctuation from a word, wherever it is."""
+    if word.isascii():
+        return word.translate(_ASCII_DELETE_PUNCTUATION)
+
+    return word.translate(_UNICODE_DELETE_PUNCTUATION)
+
+
+def leading_punctuation_length(word: str) -> int:
+    if word.isascii():
+        return len(word) - len(word.lstrip(ASCII_PUNCTUATION))
+
+    match = _UNICODE_PUNCTUATION_RUN.match(word)
+
+    return match.end() if match else 0
+
+
+def rstrip_punctuation(word: str) -> str:
+    if word.isascii():
+        return word.rstrip(ASCII_PUNCTUATION)
+
+    n = leading_punctuation_length(word[::-1])
+
+    return word[: len(word) - n]
+
+
+def is_latin(word: str) -> bool:
+    """Tests if every letter in a word is from the Latin script, with or without
+    diacritics. Words without letters are Latin too.
+    """
+    if word.isascii():
+        return True
+
+    return all(
+        not char.isalpha() or unicodedata.name(char, "").startswith("LATIN ")
+        for char in word
+    )
+
+
+def strip_diacritics(word: str) -> str:
+    """Remove combining marks from a word, e.g. "été" becomes "ete"."""
+    if word.isascii():
+        return word
+
+    return "".join(
+        char
+        for char in unicodedata.normalize("NFD", word)
+        if not unicodedata.combining(char)
+    )
+
+
+def ends_clause(word: str) -> bool:
+    """Tests if a word ends in a character that breaks the title, like a colon or
+    a dash. Closing quotes after the break are skipped.
+    """
+    word = word.rstrip(CLOSING_QUOTES)
+
+    return bool(word) and word[-1] in BREAK_CHARACTERS
@@ -0,0 +1,104 @@
+# Imports
+
+import gc
+import os
+from collections.abc import Iterable
+
+from .styler import ChicagoStyler, reset_after_fork
+from .taggers import DEFAULT_MODEL, SpacyModel, SpacyTagger, Tagger
+
+# Globals
+
+# Warm-up titles. The second one is not ASCII, so the Unicode character tables are
+# built in the parent too.
+WARM_UP_TITLES = (
+    "a warm-up title for the fbi",
+    "“foreign aid” — a reassessment of the café’s résumé…",
+)
+
+# Whether preload disabled the garbage collector, which forked children re-enable
+_GC_DISABLED = False
+
+# Functions
+
+
+def preload(
+    models: Iterable[SpacyModel] = (DEFAULT_MODEL,),
+    snapshot: str | os.PathLike | None = None,
+    freeze: bool = True,
+) -> list[Tagger]:
+    """Load models and lexicons in the master process of a pre-forking server
+    (gunicorn with ``preload_app = True``, or anything else that forks workers) so
+    the workers share them copy-on-write instead of each loading a private copy.
+
+    Each model is loaded into LOADER and run on WARM_UP_TITLES, so buffers that are
+    allocated lazily on first use are allocated before the fork. With ``freeze``,
+    this follows the recipe in the ``gc.freeze`` documentation: the garbage
+    collector is disabled before loading, so no collection frees objects in
+    between and leaves holes that later allocations fill (writing to, and so
+    copying, shared pages), and everything allocated is then moved to the
+    permanent generation, so collections in the workers do not write to the pages
+    holding these objects either. The collector stays disabled in this process and
+    is re-enabled in every forked child. Reference count updates on objects the
+    workers touch still copy those pages, but the model weights live in NumPy
+    buffers that are only read.
+
+    Call this before forking, e.g. at import of the WSGI/ASGI app module or in a
+    gunicorn ``on_starting`` hook. Workers started with the "spawn" method share
+    nothing, so this only helps servers that fork.
+
+    Args:
+        models (Iterable[SpacyModel], optional): spaCy models to load. Defaults to
+        (DEFAULT_MODEL,).
+        snapshot (str | os.PathLike | None, optional): A file from
+        ``save_snapshot`` to restore and install into LOADER instead of loading its
+        model cold. Defaults to None.
+        freeze (bool, optional): Whether to disable the garbage collector and call
+        ``gc.freeze``. Defaults to True.
+
+    Returns:
+        list[Tagger]: The loaded taggers, in case the caller wants to pass them to
+        the stylers explicitly
+    """
+    global _GC_DISABLED
+
+    if freeze and gc.isenabled():
+        gc.disable()
+        _GC_DISABLED = True
+
+    taggers: list[Tagger] = []
+    if snapshot is not None:
+        from .snapshot import load_snapshot
+
+        taggers.append(load_snapshot(snapshot, install=True).tagger)
+    taggers.extend(SpacyTagger(model) for model in models)
+
+    for tagger in taggers:
+        for title in WARM_UP_TITLES:
+            ChicagoStyler(title, tagger=tagger).title_case()
+
+    if freeze:
+        gc.freeze()
+
+    return taggers
+
+
+def _enable_gc() -> None:
+    global _GC_DISABLED
+
+    if _GC_DISABLED:
+        gc.enable()
+        _GC_DISABLED = False
+
+
+def reinit_after_fork() -> None:
+    """Re-initialize per-process state in a forked worker, e.g. from a gunicorn
+    ``post_fork`` hook, and re-enable the garbage collector if ``preload`` disabled
+    it. This already runs automatically after ``os.fork``, and is safe to call
+    again.
+    """
+    reset_after_fork()
+    _enable_gc()
+
+
+os.register_at_fork(after_in_child=_enable_gc)
@@ -0,0 +1,351 @@
+# Imports
+
+import collections
+import dataclasses
+import enum
+import os
+import sys
+import threading
+import time
+import types
+from collections.abc import Iterable
+from typing import Any
+
+from .styler import ChicagoStyler, Styler, _restart_model_executor
+from .taggers import DEFAULT_MODEL, SpacyTagger
+
+# Types
+
+Stack = tuple[str, ...]
+
+
+class ProfileMode(enum.StrEnum):
+    """DETERMINISTIC records every Python and C call with ``sys.setprofile``, which
+    is exact but slows the run down several times. SAMPLING records the stacks of
+    the running threads every ``interval`` seconds and has little overhead. Both
+    include tagger calls that run on the deadline executor threads.
+    """
+
+    DETERMINISTIC = "deterministic"
+    SAMPLING = "sampling"
+
+
+@dataclasses.dataclass
+class Hotspot:
+    function: str
+    self_seconds: float
+    total_seconds: float
+
+
+@dataclasses.dataclass
+class ProfileReport:
+    """Where the time went while casing a corpus.
+
+    ``stacks`` maps call stacks (outermost first) to the seconds spent with that
+    stack on top. ``pipe_seconds`` is the time spent in each spaCy pipe, measured in
+    a separate pass over the same titles.
+    """
+
+    mode: ProfileMode
+    titles: int
+    seconds: float
+    stacks: collections.Counter[Stack]
+    pipe_seconds: dict[str, float]
+
+    def hotspots(self) -> list[Hotspot]:
+        """Functions ranked by self time, i.e. excluding the functions they call."""
+        self_seconds: collections.Counter[str] = collections.Counter()
+        total_seconds: collections.Counter[str] = collections.Counter()
+        for stack, seconds in self.stacks.items():
+            self_seconds[stack[-1]] += seconds
+            # Count recursive functions once per stack
+            for function in set(stack):
+                total_seconds[function] += seconds
+
+        return [
+            Hotspot(function, self_seconds[function], total_seconds[function])
+            for function in sorted(
+                total_seconds,
+                key=lambda f: (self_seconds[f], total_seconds[f]),
+                reverse=True,
+            )
+        ]
+
+    def format(self, limit: int = 25) -> str:
+        lines = [
+            f"{self.titles:,} titles in {self.seconds:.3f}s"
+            f" ({self.titles / self.seconds:,.0f} titles/s, {self.mode} profiler)",
+            "",
+            f"{'self s':>9} {'self %':>7} {'total s':>9} {'total %':>7}  function",
+        ]
+        profiled = sum(self.stacks.values()) or 1.0
+        for hotspot in self.hotspots()[:limit]:
+            lines.append(
+                f"{hotspot.self_seconds:>9.4f} {hotspot.self_seconds / profiled:>7.1%}"
+                f" {hotspot.total_seconds:>9.4f}"
+                f" {hotspot.total_seconds / profiled:>7.1%}  {hotspot.function}"
+            )
+
+        if self.pipe_seconds:
+            lines += ["", "spaCy pipes:"]
+            pipes_total = sum(self.pipe_seconds.values()) or 1.0
+            for name, seconds in self.pipe_seconds.items():
+                lines.append(f"{seconds:>9.4f} {seconds / pipes_total:>7.1%}  {name}")
+
+        return "\n".join(lines)
+
+    def write_collapsed(self, path: str | os.PathLike) -> None:
+        """Write the stacks in the collapsed format read by flamegraph.pl, speedscope
+        and similar tools: one ``frame;frame;frame count`` line per stack, with the
+        count in microseconds.
+        """
+        with open(path, "w") as f:
+            for stack, seconds in sorted(self.stacks.items()):
+                microseconds = round(seconds * 1e6)
+                if microseconds:
+                    f.write(f"{';'.join(stack)} {microseconds}\n")
+
+
+def _label(code: types.CodeType) -> str:
+    return f"{os.path.basename(code.co_filename)}:{code.co_qualname}"
+
+
+def _c_label(func: Any) -> str:
+    module = getattr(func, "__module__", None) or "builtins"
+
+    return f"{module}.{getattr(func, '__qualname__', repr(func))}"
+
+
+# Tagger calls with a deadline run this on an executor thread. On other threads
+# than the profiled one, only the stacks below it are recorded.
+THREAD_ROOT = Styler._run_tagger.__code__
+
+
+@dataclasses.dataclass
+class _ThreadProfile:
+    """What the deterministic profiler recorded on one thread. ``depth`` is the
+    length of ``stack`` when recording started, or None while the thread is outside
+    the code being profiled.
+    """
+
+    depth: int | None
+    stack: list[str] = dataclasses.field(default_factory=list)
+    stacks: collections.Counter[Stack] = dataclasses.field(
+        default_factory=collections.Counter
+    )
+    last: float = dataclasses.field(default_factory=time.perf_counter)
+
+
+class _Tracer:
+    """Deterministic profiler that keeps the full call stack of each thread, so the
+    time between two profile events on a thread is charged to the exact stack that
+    was running on it.
+    """
+
+    def __init__(self) -> None:
+        self._thread_id = threading.get_ident()
+        self._local = threading.local()
+        self._threads: list[_ThreadProfile] = []
+        self._active = False
+
+    @property
+    def stacks(self) -> collections.Counter[Stack]:
+        stacks: collections.Counter[Stack] = collections.Counter()
+        for thread in self._threads:
+            stacks.update(thread.stacks)
+
+        return stacks
+
+    def _thread(self) -> _ThreadProfile:
+        try:
+            return self._local.profile
+        except AttributeError:
+            profiled = threading.get_ident() == self._thread_id
+            thread = self._local.profile = _ThreadProfile(depth=0 if profiled else None)
+            self._threads.append(thread)
+
+            return thread
+
+    def __call__(self, frame: types.FrameType, event: str, arg: Any) -> None:
+        if not self._active:
+            # A thread that was started while profiling
+            sys.setprofile(None)
+            return
+
+        now = time.perf_counter()
+        thread = self._thread()
+        if thread.depth is not None and len(thread.stack) > thread.depth:
+            thread.stacks[tuple(thread.stack[thread.depth :])] += now - thread.last
+        thread.last = now
+
+        if event == "call":
+            if thread.depth is None and frame.f_code is THREAD_ROOT:
+                thread.depth = len(thread.stack)
+            thread.stack.append(_label(frame.f_code))
+        elif event == "c_call":
+            thread.stack.append(_c_label(arg))
+        elif thread.stack:  # return, c_return, c_exception
+            thread.stack.pop()
+            if frame.f_code is THREAD_ROOT and len(thread.stack) == thread.depth:
+                thread.depth = None
+
+    def __enter__(self) -> "_Tracer":
+        self._active = True
+        setprofile_all_threads = getattr(threading, "setprofile_all_threads", None)
+        if setprofile_all_threads is not None:  # Python 3.12+
+            setprofile_all_threads(self)
+        else:
+            # Only new threads can be hooked, so replace the executor threads
+            _restart_model_executor()
+            threading.setprofile(self)
+            sys.setprofile(self)
+
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._active = False
+        setprofile_all_threads = getattr(threading, "setprofile_all_threads", None)
+        if setprofile_all_threads is not None:
+            setprofile_all_threads(None)
+        else:
+            threading.setprofile(None)  # type: ignore[arg-type]
+            sys.setprofile(None)
+
+
+class _Sampler:
+    """Sampling profiler that records the stacks of all threads from a background
+    thread: the profiled thread below ``root``, and the others from THREAD_ROOT
+    down. A sample can only be taken when the running thread releases the GIL,
+    which the interpreter forces every ``sys.getswitchinterval()`` seconds, so
+    intervals below that are not meaningful.
+    """
+
+    def __init__(self, interval: float, root: types.CodeType) -> None:
+        self.interval = interval
+        self.stacks: collections.Counter[Stack] = collections.Counter()
+        self._root = root
+        self._thread_id = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @staticmethod
+    def _sample(
+        frame: types.FrameType | None, root: types.CodeType, keep_root: bool
+    ) -> Stack:
+        """The stack from ``root`` to ``frame``, or an empty one if ``root`` is not
+        on the stack.
+        """
+        stack = []
+        while frame is not None:
+            if frame.f_code is root:
+                if keep_root:
+                    stack.append(_label(frame.f_code))
+
+                return tuple(reversed(stack))
+
+            stack.append(_label(frame.f_code))
+            frame = frame.f_back
+
+        return ()
+
+    def _run(self) -> None:
+        last = time.perf_counter()
+        while not self._stop.wait(self.interval):
+            now = time.perf_counter()
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == self._thread_id:
+                    stack = self._sample(frame, self._root, keep_root=False)
+                elif thread_id != threading.get_ident():
+                    stack = self._sample(frame, THREAD_ROOT, keep_root=True)
+                else:
+                    continue
+
+                if stack:
+                    self.stacks[stack] += now - last
+            last = now
+
+    def __enter__(self) -> "_Sampler":
+        self._thread.start()
+
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._thread.join()
+
+
+def _case_titles(styler_kwargs: dict[str, Any], titles: list[str]) -> None:
+    for title in titles:
+        ChicagoStyler(title, **styler_kwargs).title_case()
+
+
+def _pipe_seconds(tagger: Any, titles: Iterable[str]) -> dict[str, float]:
+    """Run the titles through each spaCy pipe by hand to time them one by one."""
+    if not isinstance(tagger, SpacyTagger):
+        return {}
+
+    nlp = tagger.nlp
+    seconds = {"tokenizer": 0.0, **{name: 0.0 for name in nlp.pipe_names}}
+    for title in titles:
+        cleaned = ChicagoStyler._clean(title)
+        if not cleaned:
+            continue
+
+        start = time.perf_counter()
+        doc = nlp.make_doc(cleaned)
+        seconds["tokenizer"] += time.perf_counter() - start
+
+        for name, proc in nlp.pipeline:
+            start = time.perf_counter()
+            doc = proc(doc)
+            seconds[name] += time.perf_counter() - start
+
+    return seconds
+
+
+def profile_titles(
+    titles: list[str],
+    mode: ProfileMode = ProfileMode.SAMPLING,
+    interval: float = 0.005,
+    **styler_kwargs,
+) -> ProfileReport:
+    """Title case a corpus with ChicagoStyler under a profiler.
+
+    Args:
+        titles (list[str]): The titles
+        mode (ProfileMode, optional): Profiler to use. Defaults to
+        ProfileMode.SAMPLING.
+        interval (float, optional): Seconds between samples in sampling mode.
+        Defaults to 0.005.
+        **styler_kwargs: Passed to ChicagoStyler, e.g. acronyms or tagger
+
+    Returns:
+        ProfileReport: Ranked hotspots, collapsed stacks and spaCy pipe timings
+    """
+    mode = ProfileMode(mode)
+    # Build the tagger up front, so the pipes can be timed on the same model
+    if styler_kwargs.get("tagger") is None:
+        model = styler_kwargs.pop("model", DEFAULT_MODEL)
+        styler_kwargs["tagger"] = SpacyTagger(model)
+
+    # Load the model and warm up caches outside the profile
+    _case_titles(styler_kwargs, titles[:1])
+
+    profiler: _Tracer | _Sampler
+    if mode == ProfileMode.DETERMINISTIC:
+        profiler = _Tracer()
+    else:
+        profiler = _Sampler(interval, _case_titles.__code__)
+
+    start = time.perf_counter()
+    with profiler:
+        _case_titles(styler_kwargs, titles)
+    seconds = time.perf_counter() - start
+
+    return ProfileReport(
+        mode=mode,
+        titles=len(titles),
+        seconds=seconds,
+        stacks=profiler.stacks,
+        pipe_seconds=_pipe_seconds(styler_kwargs["tagger"], titles),
+    )
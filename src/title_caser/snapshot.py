@@ -0,0 +1,174 @@
+# Imports
+
+import dataclasses
+import os
+import pickle
+import struct
+
+import numpy as np
+import spacy
+from spacy.vectors import Vectors
+
+from .hardcoded_words import ACRONYMS, SPECIAL
+from .styler import ChicagoStyler
+from .taggers import DEFAULT_MODEL, LOADER, SpacyModel, SpacyTagger
+
+# Globals
+
+SNAPSHOT_VERSION = 2
+
+# A snapshot file is this header, the pickled metadata and pipeline, and then the
+# raw vectors table at the next multiple of VECTORS_ALIGNMENT, so it can be
+# memory-mapped instead of read into memory
+SNAPSHOT_MAGIC = b"TCSNAP\0\0"
+_HEADER = struct.Struct("<8sIQ")  # magic, version, length of the pickled part
+VECTORS_ALIGNMENT = 4096
+
+# The only components needed for token.tag_. Everything else (parser, ner,
+# lemmatizer, ...) is dropped from the snapshot.
+TAGGER_PIPES = ("tok2vec", "transformer", "tagger")
+
+# Types
+
+
+@dataclasses.dataclass
+class Snapshot:
+    model: SpacyModel
+    acronyms: frozenset[str]
+    special: dict[str, str]
+    tagger: SpacyTagger
+
+    def styler(self, title: str = "", **kwargs) -> ChicagoStyler:
+        return ChicagoStyler(
+            title,
+            acronyms=self.acronyms,
+            special=self.special,
+            tagger=self.tagger,
+            **kwargs,
+        )
+
+
+def save_snapshot(
+    path: str | os.PathLike,
+    model: SpacyModel = DEFAULT_MODEL,
+    acronyms: set[str] = ACRONYMS,
+    special: dict[str, str] = SPECIAL,
+) -> None:
+    """Save a configured styler to a single file: the spaCy pipeline reduced to the
+    components the tagger needs, and the acronym and special word lexicons.
+
+    Args:
+        path (str | os.PathLike): The snapshot file
+        model (SpacyModel, optional): The spaCy model. Defaults to DEFAULT_MODEL.
+        acronyms (set[str], optional): A set of acronyms. Defaults to ACRONYMS.
+        special (dict[str, str], optional): Special words. Defaults to SPECIAL.
+    """
+    # Load a private copy, since pipes are removed from it. Disabled components are
+    # removed too, or they would still be saved and restored.
+    nlp = spacy.load(model)
+    for name in nlp.component_names:
+        if name not in TAGGER_PIPES:
+            nlp.remove_pipe(name)
+
+    # The vectors table is by far the largest part of the models with vectors, so
+    # it is stored as a raw array instead of inside nlp.to_bytes
+    vectors = nlp.vocab.vectors
+    data = np.empty((0, 0), dtype=np.float32)
+    if isinstance(vectors, Vectors):
+        data = np.ascontiguousarray(vectors.data)
+
+    snapshot = {
+        "spacy_version": spacy.__version__,
+        "model": str(model),
+        "config": nlp.config.to_str(),
+        "nlp": nlp.to_bytes(exclude=["tokenizer", "vectors"]),
+        "vectors": (
+            vectors.to_bytes(exclude=["strings", "vectors"])
+            if isinstance(vectors, Vectors)
+            else None
+        ),
+        "vectors_dtype": data.dtype.str,
+        "vectors_shape": data.shape,
+        "acronyms": frozenset(acronyms),
+        "special": dict(special),
+    }
+    pickled = pickle.dumps(snapshot, protocol=pickle.HIGHEST_PROTOCOL)
+
+    tmp = f"{os.fspath(path)}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(pickled)))
+        f.write(pickled)
+        f.write(b"\0" * (_vectors_offset(len(pickled)) - f.tell()))
+        data.tofile(f)
+    os.replace(tmp, path)
+
+
+def _vectors_offset(pickled_length: int) -> int:
+    end = _HEADER.size + pickled_length
+
+    return -(-end // VECTORS_ALIGNMENT) * VECTORS_ALIGNMENT
+
+
+def load_snapshot(path: str | os.PathLike, install: bool = False) -> Snapshot:
+    """Restore a snapshot written by ``save_snapshot``. This skips spacy.load's
+    package lookup, the components that are not needed for tagging and rebuilding the
+    lexicons. The vectors table is memory-mapped rather than read, so pages are only
+    loaded as words are looked up and are shared between processes. The file must
+    therefore stay in place while the snapshot is in use. Snapshots contain pickles,
+    so only load files you created.
+
+    Args:
+        path (str | os.PathLike): The snapshot file
+        install (bool, optional): Also register the restored pipeline with LOADER,
+        so stylers created with the snapshot's model use it. Defaults to False.
+
+    Raises:
+        ValueError: If the snapshot was written by another snapshot format or spaCy
+        version
+
+    Returns:
+        Snapshot: The restored model, lexicons and tagger
+    """
+    with open(path, "rb") as f:
+        magic, version, pickled_length = _HEADER.unpack(f.read(_HEADER.size))
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f"{path} is not a snapshot written by this version")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version {version}")
+
+        snapshot = pickle.loads(f.read(pickled_length))
+
+    if snapshot["spacy_version"] != spacy.__version__:
+        raise ValueError(
+            f"Snapshot was written with spaCy {snapshot['spacy_version']}, but spaCy"
+            f" {spacy.__version__} is installed"
+        )
+
+    config = spacy.util.load_config_from_str(snapshot["config"])
+    nlp = spacy.util.load_model_from_config(config, auto_fill=False, validate=False)
+    nlp.from_bytes(snapshot["nlp"], exclude=["tokenizer", "vectors"])
+
+    if snapshot["vectors"] is not None:
+        vectors = nlp.vocab.vectors
+        vectors.from_bytes(snapshot["vectors"], exclude=["strings", "vectors"])
+        shape = tuple(snapshot["vectors_shape"])
+        if np.prod(shape):
+            vectors.data = np.memmap(
+                path,
+                dtype=np.dtype(snapshot["vectors_dtype"]),
+                mode="r",
+                offset=_vectors_offset(pickled_length),
+                shape=shape,
+            )
+
+    model = SpacyModel(snapshot["model"])
+    tagger = SpacyTagger.from_nlp(nlp)
+    if install:
+        LOADER.install(model, nlp)
+
+    return Snapshot(
+        model=model,
+        acronyms=snapshot["acronyms"],
+        special=snapshot["special"],
+        tagger=tagger,
+    )
@@ -1,59 +1,163 @@
 # Imports
 
+import collections
+import concurrent.futures
 import dataclasses
 import enum
+import itertools
+import os
 import re
-import string
+import threading
+import time
+import typing
 
 import cutils
-import nltk
-import spacy
-
+import numpy as np
+
+from .charclass import (
+    ends_clause,
+    is_latin,
+    leading_punctuation_length,
+    rstrip_punctuation,
+    strip_diacritics,
+    strip_punctuation,
+)
 from .hardcoded_words import (
     ACRONYMS,
     ARTICLES,
+    CONJUNCTIONS,
     PREFIXES,
     PREPOSITIONS,
     SPECIAL,
     VALID_TWO_LETTER_WORDS,
 )
+from .taggers import (
+    DEFAULT_MODEL,
+    LexiconTagger,
+    SpacyModel,
+    SpacyTagger,
+    Tagger,
+    TaggedText,
+)
+from .taggers import __getattr__  # noqa: F401  # deprecated DEFAULT_SPACY_MODEL
 
 # Globals
 
-nltk.download("averaged_perceptron_tagger", quiet=True)
-nltk.download("punkt", quiet=True)
+ROMAN_NUMERAL_RE = re.compile(
+    r"^M{0,3}(CM|CD|D?C{0,3})(XC|XL|L?X{0,3})(IX|IV|V?I{0,3})$"
+)
+
+# Consider "y" a vowel, don't want, e.g. spy to be an acronym
+VOWELS = frozenset("aeiouy")
+
+# Maximum number of words a decision table admits beyond the lexicon
+DECISION_TABLE_MAX_SIZE = 20_000
+
+# A word is admitted to a decision table on its this many-th lookup, so words that
+# are only seen once or twice do not fill the table
+DECISION_TABLE_ADMIT_AFTER = 3
+
+# Number of acronyms and special words configurations whose tables are kept
+DECISION_TABLES_MAX = 8
 
 # Types
 
 
-class SpacyModel(enum.StrEnum):
-    LG = "en_core_web_lg"
-    SM = "en_core_web_sm"
-    MD = "en_core_web_md"
-    TRF = "en_core_web_trf"
+class Overflow(enum.StrEnum):
+    """What to do with a title longer than ``max_chars`` or ``max_tokens``.
+
+    TRUNCATE drops the words past the limit, CHUNK keeps the whole title but runs the
+    model on pieces that fit within the limits, and REJECT raises TitleTooLongError.
+    With CHUNK, a single word longer than ``max_chars`` is cut to ``max_chars`` for
+    the model, and the output keeps the whole word.
+    """
+
+    TRUNCATE = "truncate"
+    CHUNK = "chunk"
+    REJECT = "reject"
+
+
+class TitleTooLongError(ValueError):
+    pass
+
+
+# Tagger calls with a deadline run on these threads so the caller can stop waiting
+# for them. A call that misses its deadline keeps its thread until it finishes, so
+# there are enough threads that a few abandoned calls do not hold up the others.
+# Calls without a deadline run on the caller's thread.
+MODEL_THREADS = min(32, (os.cpu_count() or 1) + 4)
+
+_MODEL_EXECUTOR: concurrent.futures.ThreadPoolExecutor | None = None
+_MODEL_EXECUTOR_LOCK = threading.Lock()
+
+
+def _model_executor() -> concurrent.futures.ThreadPoolExecutor:
+    global _MODEL_EXECUTOR
+
+    with _MODEL_EXECUTOR_LOCK:
+        if _MODEL_EXECUTOR is None:
+            _MODEL_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+                max_workers=MODEL_THREADS, thread_name_prefix="title_caser"
+            )
+
+        return _MODEL_EXECUTOR
+
+
+def _restart_model_executor() -> None:
+    """Let the idle executor threads exit, so calls from now on run on new threads,
+    e.g. ones a profiler can hook into.
+    """
+    global _MODEL_EXECUTOR
+
+    with _MODEL_EXECUTOR_LOCK:
+        if _MODEL_EXECUTOR is not None:
+            _MODEL_EXECUTOR.shutdown(wait=False)
+            _MODEL_EXECUTOR = None
+
 
+def reset_after_fork() -> None:
+    """Reset per-process state in a forked child. The parent's executor thread does
+    not exist in the child and its locks may have been held at fork time, so the
+    child starts over with a fresh executor, lock and degradation counters. This
+    runs automatically after ``os.fork``.
+    """
+    global _MODEL_EXECUTOR, _MODEL_EXECUTOR_LOCK
 
-DEFAULT_SPACY_MODEL = spacy.load(SpacyModel.LG)
+    _MODEL_EXECUTOR = None
+    _MODEL_EXECUTOR_LOCK = threading.Lock()
+    DEGRADATION_STATS._lock = threading.Lock()
+    DEGRADATION_STATS.reset()
 
 
-class SpacyModelLoader:
+class DegradationStats:
+    """Counts how often a deadline was missed. Every ``title_case`` call on a styler
+    with a deadline and every ``title_case_batch`` call with a deadline counts once,
+    however many times it ran the tagger.
+    """
+
     def __init__(self) -> None:
-        # Load the default model
-        self._models: dict[SpacyModel, spacy.Language] = {
-            SpacyModel.LG: DEFAULT_SPACY_MODEL
-        }
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.degraded = 0
 
-    def load(self, model: SpacyModel):
-        if model not in self._models:
-            nlp = spacy.load(model)
-            self._models[model] = nlp
+    def record(self, degraded: bool) -> None:
+        with self._lock:
+            self.calls += 1
+            self.degraded += degraded
 
-            return nlp
+    def reset(self) -> None:
+        with self._lock:
+            self.calls = 0
+            self.degraded = 0
 
-        return self._models[model]
+    @property
+    def degraded_ratio(self) -> float:
+        return self.degraded / self.calls if self.calls else 0.0
 
 
-LOADER = SpacyModelLoader()
+DEGRADATION_STATS = DegradationStats()
+
+os.register_at_fork(after_in_child=reset_after_fork)
 
 
 @dataclasses.dataclass
@@ -76,29 +180,83 @@ class WordInfo:
     is_subordinating_conjuction: bool = False
 
 
-class WhitespaceTokenizer(object):
-    """By default, spacy splits on things other than the whitespace, including dashes,
-    and so on. We want to split ONLY on the whitespace.
+class WordFlag(enum.IntFlag):
+    """Bit positions of the boolean ``WordInfo`` fields, used to pack a word's
+    features into a single uint16 for columnar batches.
     """
 
-    def __init__(self, vocab: spacy.vocab.Vocab) -> None:
-        self.vocab = vocab
+    ACRONYM = enum.auto()
+    AFTER_PUNCTUATION = enum.auto()
+    ARTICLE = enum.auto()
+    COORDINATING_CONJUNCTION = enum.auto()
+    FIRST_WORD = enum.auto()
+    FIRST_WORD_OF_PARANTHETICAL = enum.auto()
+    HYPHENATED = enum.auto()
+    LAST_WORD = enum.auto()
+    PLURAL_ACRONYM = enum.auto()
+    PREFIX = enum.auto()
+    PREPOSITION = enum.auto()
+    PROPER = enum.auto()
+    ROMAN_NUMERAL = enum.auto()
+    SUBORDINATING_CONJUNCTION = enum.auto()
+
+
+class Casing(enum.IntEnum):
+    """The casing operation chosen for a word by the vectorized rules."""
+
+    LOWER = 0
+    CAPITALIZE = 1
+    CAPITALIZE_IGNORE_PUNCTUATION = 2
+    UPPER = 3
+    PLURAL_ACRONYM = 4
+    HYPHENATED = 5
 
-    def __call__(self, text: str):
-        words = text.split(" ")
-        # All tokens "own" a subsequent space character in this tokenizer
-        spaces = [True] * len(words)
 
-        return spacy.tokens.Doc(self.vocab, words=words, spaces=spaces)
+@dataclasses.dataclass
+class TaggedBatch:
+    """Columnar result of tagging many titles at once.
+
+    Token ``i`` is ``text[starts[i]:ends[i]]`` and has POS tag ``tags[i]`` and
+    features ``flags[i]`` (a combination of ``WordFlag`` bits). The tokens of title
+    ``j`` are ``title_bounds[j]:title_bounds[j + 1]``. ``degraded`` is True if the
+    deadline was missed and the tags come from the lexicon instead of the model.
+    """
+
+    text: str
+    starts: np.ndarray
+    ends: np.ndarray
+    tags: list[str]
+    flags: np.ndarray
+    title_bounds: np.ndarray
+    degraded: bool = False
+
+    def __len__(self) -> int:
+        return len(self.title_bounds) - 1
+
+    def word(self, idx: int) -> str:
+        return self.text[self.starts[idx] : self.ends[idx]]
+
+    def words(self) -> list[str]:
+        text = self.text
+
+        return [text[s:e] for s, e in zip(self.starts.tolist(), self.ends.tolist())]
+
+    def has(self, flag: WordFlag) -> np.ndarray:
+        return (self.flags & flag) != 0
 
 
 class Styler:
     def __init__(
         self,
-        title: str,
+        title: str = "",
         acronyms: set[str] = ACRONYMS,
         special: dict[str, str] = SPECIAL,
-        model: SpacyModel = SpacyModel.LG,
+        model: SpacyModel = DEFAULT_MODEL,
+        deadline: float | None = None,
+        max_chars: int | None = None,
+        max_tokens: int | None = None,
+        overflow: Overflow = Overflow.TRUNCATE,
+        tagger: Tagger | None = None,
     ):
         """Title is required to be passed in. Acronyms may be passed in since it is
         desireable for the user to be able to define a custom list of acronyms, e.g. for
@@ -107,24 +265,138 @@ class Styler:
         Args:
             title (str): The title
             acronyms (set[str], optional): A set of acronyms. Defaults to ACRONYMS.
+            deadline (float | None, optional): Latency budget in seconds for tagging
+            and casing this title. If the model cannot finish in time, the words are
+            tagged from the hardcoded word lists instead and ``degraded`` is set.
+            Defaults to None, which always waits for the model.
+            max_chars (int | None, optional): Maximum length of the cleaned title.
+            Defaults to None.
+            max_tokens (int | None, optional): Maximum number of words in the cleaned
+            title. Defaults to None.
+            overflow (Overflow, optional): How to handle titles over either limit.
+            Defaults to Overflow.TRUNCATE.
+            tagger (Tagger | None, optional): The part-of-speech tagger. Defaults to
+            None, which uses a SpacyTagger for ``model``.
         """
-        self._nlp = LOADER.load(model)
-        self._nlp.tokenizer = WhitespaceTokenizer(self._nlp.vocab)
+        self._tagger = SpacyTagger(model) if tagger is None else tagger
+
+        self._deadline_at = None if deadline is None else time.monotonic() + deadline
+        self.degraded = False
+
+        self._max_chars = max_chars
+        self._max_tokens = max_tokens
+        self._overflow = Overflow(overflow)
 
         self._title = title
         self._acronyms = acronyms
         self._special = special
-        self._words = self.clean_title()
+        self._words = self._limit(self.clean_title())
         self._tagged_words = self.tag_words(self._words)
 
     def clean_title(self) -> str:
-        title = self._title
+        return self._clean(self._title)
+
+    @staticmethod
+    def _clean(title: str) -> str:
         title = title.strip()  # strip whitespace off ends
         title = " ".join(title.split())  # normalize whitespace to one
         title = title.lower()
 
         return title
 
+    def _over_limit(self, n_chars: int, n_tokens: int) -> bool:
+        return (self._max_chars is not None and n_chars > self._max_chars) or (
+            self._max_tokens is not None and n_tokens > self._max_tokens
+        )
+
+    def _limit(self, title: str) -> str:
+        """Apply the truncate and reject overflow policies to a cleaned title."""
+        if self._overflow == Overflow.CHUNK or not title:
+            return title
+
+        words = title.split(" ")
+        if not self._over_limit(len(title), len(words)):
+            return title
+
+        if self._overflow == Overflow.REJECT:
+            raise TitleTooLongError(
+                f"Title has {len(title)} characters and {len(words)} words, limits are"
+                f" max_chars={self._max_chars} and max_tokens={self._max_tokens}"
+            )
+
+        if self._max_tokens is not None:
+            words = words[: self._max_tokens]
+
+        if self._max_chars is not None:
+            n_chars = -1
+            for idx, word in enumerate(words):
+                n_chars += len(word) + 1
+                if n_chars > self._max_chars:
+                    # Keep at least part of the first word rather than returning an
+                    # empty title
+                    words = words[:idx] or [word[: self._max_chars]]
+                    break
+
+        return " ".join(words)
+
+    def _chunk(self, text: str) -> list[str]:
+        """Split a cleaned title into pieces within the limits for the model. Only
+        the chunk overflow policy splits anything.
+        """
+        if self._overflow != Overflow.CHUNK:
+            return [text]
+
+        words = text.split(" ")
+        if not self._over_limit(len(text), len(words)):
+            return [text]
+
+        chunks = []
+        chunk: list[str] = []
+        n_chars = -1
+        for word in words:
+            if self._max_chars is not None:
+                # The tag of a word that does not fit on its own comes from its start
+                word = word[: self._max_chars]
+
+            if chunk and self._over_limit(n_chars + len(word) + 1, len(chunk) + 1):
+                chunks.append(" ".join(chunk))
+                chunk = []
+                n_chars = -1
+
+            chunk.append(word)
+            n_chars += len(word) + 1
+
+        chunks.append(" ".join(chunk))
+
+        return chunks
+
+    def _model_tags_chunked(
+        self, texts: list[str], deadline_at: float | None = None, batch_size: int = 256
+    ) -> tuple[list[TaggedText], bool]:
+        """Like ``_model_tags``, but texts over the limits are sent to the model in
+        chunks and the tags of the chunks are joined back together.
+        """
+        chunked = [self._chunk(text) for text in texts]
+        all_chunk_tags, degraded = self._model_tags(
+            list(itertools.chain.from_iterable(chunked)), deadline_at, batch_size
+        )
+        chunk_tags_iter = iter(all_chunk_tags)
+        all_model_tags = []
+        for text, chunks in zip(texts, chunked):
+            model_tags = list(
+                itertools.chain.from_iterable(
+                    next(chunk_tags_iter) for _ in range(len(chunks))
+                )
+            )
+            if chunks != [text]:
+                # Put back the words that were cut to fit
+                model_tags = [
+                    (word, tag) for word, (_, tag) in zip(text.split(" "), model_tags)
+                ]
+            all_model_tags.append(model_tags)
+
+        return all_model_tags, degraded
+
     @staticmethod
     def is_article(word) -> bool:
         return word in ARTICLES
@@ -135,15 +407,14 @@ class Styler:
 
     @staticmethod
     def has_no_vowels(word: str) -> bool:
-        vowels = "aeiouy"  # Consider "y" a vowel, don't want, e.g. spy to be an acronym
-
-        return all(char not in vowels for char in word)
+        """Only Latin-script words can lack vowels. Accented vowels count as
+        vowels.
+        """
+        return is_latin(word) and VOWELS.isdisjoint(strip_diacritics(word))
 
     @staticmethod
     def is_roman_numeral(word: str) -> bool:
-        r = re.compile(r"^M{0,3}(CM|CD|D?C{0,3})(XC|XL|L?X{0,3})(IX|IV|V?I{0,3})$")
-
-        return bool(re.search(r, word))
+        return bool(ROMAN_NUMERAL_RE.search(word))
 
     def is_acronym(self, word: str) -> bool:
         """There is no good way of determining if a a word is an acronym. Therefore,
@@ -159,6 +430,10 @@ class Styler:
         of all two letter words). Note that this list does not contain "us", since it is
         much more likely that "us" refers to "US" in a title.
 
+        Words with no vowels (other than a few, like "cwm") are acronyms as well. This
+        rule and rule 4 only apply to Latin-script words, since both rely on English
+        spelling.
+
         Args:
             word (str): _description_
 
@@ -166,7 +441,7 @@ class Styler:
             bool: _description_
         """
         words_with_no_vowels = {"crwth", "crwths", "cwm", "cwms"}
-        word_no_punc = word.translate(word.maketrans("", "", string.punctuation))
+        word_no_punc = strip_punctuation(word)
         word_no_punc_len = len(word_no_punc)
         cond = (
             word_no_punc in self._acronyms
@@ -178,13 +453,14 @@ class Styler:
             or (self.between_parantheses(word) and word_no_punc_len <= 4)
             or word_no_punc_len == 2
             and word_no_punc not in VALID_TWO_LETTER_WORDS
+            and is_latin(word_no_punc)
         )
 
         return cond
 
     def is_plural_acronym(self, word: str) -> bool:
-        word_no_trailing_punc = word.rstrip(string.punctuation)
-        if word_no_trailing_punc[-1] == "s":
+        word_no_trailing_punc = rstrip_punctuation(word)
+        if word_no_trailing_punc.endswith("s"):
             s_pos = cutils.find_last_index(word, "s")
             word_no_s = word[:s_pos] + word[s_pos + 1 :]
 
@@ -228,6 +504,8 @@ class Styler:
     def is_after_punctuation(previous_word: str) -> bool:
         """Tests if the word comes after a word that ends in punctuation, e.g.
             "Empirical Investment Equations: An Integrative Framework"
+        Unicode dashes and the ellipsis count too, e.g.
+            "Foreign Aid — A Reassessment"
 
         Args:
             previous_word (str): The previous word in the title
@@ -235,9 +513,7 @@ class Styler:
         Returns:
             bool:
         """
-        puncs = {":", "?", "!", ".", "--", "-"}
-
-        return previous_word[-1] in puncs
+        return ends_clause(previous_word)
 
     @staticmethod
     def is_first_word_of_paranthetical(word: str) -> bool:
@@ -253,7 +529,8 @@ class Styler:
     @staticmethod
     def capitalize(word: str) -> str:
         """Capitalize but ignore punctuation. This is needed because the builtin
-        .capitalize() method will return "(the" from "(the" instead of "(The".
+        .capitalize() method will return "(the" from "(the" instead of "(The". Unicode
+        punctuation like curly quotes is skipped as well.
 
         Args:
             word (str): word
@@ -261,29 +538,28 @@ class Styler:
         Returns:
             str: capitalized word
         """
-        word_lst = []
-        first = True
-        for c in word:
-            if c not in string.punctuation and first:
-                c = c.upper()
-                first = False
-
-            word_lst.append(c)
+        idx = leading_punctuation_length(word)
 
-        return "".join(word_lst)
+        return word[:idx] + word[idx : idx + 1].upper() + word[idx + 1 :]
 
     def replace_special(self, word: str) -> str:
+        """Replace a special word, keeping any punctuation around it, as in
+        “iphone” or (phd).
+        """
         key = word.lower()
         if key in self._special:
-            corrected_word = self._special[key]
-        else:
-            corrected_word = word
+            return self._special[key]
+        if word[:1].isalnum() and word[-1:].isalnum():
+            return word
 
-        return corrected_word
+        start = leading_punctuation_length(word)
+        end = len(rstrip_punctuation(word))
+        if key[start:end] in self._special:
+            return word[:start] + self._special[key[start:end]] + word[end:]
 
-    def tag_words(self, words: str) -> list[WordInfo]:
-        doc = self._nlp(words)
-        model_tags = [(token.text, token.tag_) for token in doc]
+        return word
+
+    def _tag_model_output(self, model_tags: TaggedText) -> list[WordInfo]:
         tagged_words = []
         for idx, word_tag in enumerate(model_tags):
             word, tag = word_tag
@@ -321,17 +597,266 @@ class Styler:
 
         return tagged_words
 
+    def _word_features(self, word: str) -> tuple[int, bool]:
+        """The ``WordFlag`` bits of a word that only depend on the word itself, and
+        whether the word ends a clause, i.e. sets AFTER_PUNCTUATION on the next word.
+        """
+        word_flags = 0
+        if self.is_acronym(word):
+            word_flags |= WordFlag.ACRONYM
+        if self.is_article(word):
+            word_flags |= WordFlag.ARTICLE
+        if self.is_first_word_of_paranthetical(word):
+            word_flags |= WordFlag.FIRST_WORD_OF_PARANTHETICAL
+        if self.is_hyphenated(word):
+            word_flags |= WordFlag.HYPHENATED
+        if self.is_plural_acronym(word):
+            word_flags |= WordFlag.PLURAL_ACRONYM
+        if self.is_prefix(word):
+            word_flags |= WordFlag.PREFIX
+        if self.is_preposition(word):
+            word_flags |= WordFlag.PREPOSITION
+        if self.is_roman_numeral(word):
+            word_flags |= WordFlag.ROMAN_NUMERAL
+
+        return word_flags, self.is_after_punctuation(word)
+
+    def _run_tagger(self, texts: list[str], batch_size: int) -> list[TaggedText]:
+        return self._tagger.tag(texts, batch_size=batch_size)
+
+    def _model_tags(
+        self, texts: list[str], deadline_at: float | None = None, batch_size: int = 256
+    ) -> tuple[list[TaggedText], bool]:
+        """Run the tagger over the texts. With a deadline, the tagger runs on an
+        executor thread and if it has not finished by the deadline the texts are
+        tagged by a LexiconTagger instead. Also returns whether that happened.
+        """
+        # The lexicon tagger is the fallback itself, so it is never worth a thread
+        if deadline_at is None or isinstance(self._tagger, LexiconTagger):
+            return self._run_tagger(texts, batch_size), False
+
+        remaining = deadline_at - time.monotonic()
+        if remaining > 0:
+            future = _model_executor().submit(self._run_tagger, texts, batch_size)
+            try:
+                return future.result(timeout=remaining), False
+            except concurrent.futures.TimeoutError:
+                # A call that is still queued is dropped, but one that already
+                # started cannot be interrupted and finishes in the background
+                future.cancel()
+
+        return LexiconTagger().tag(texts), True
+
+    def tag_words(self, words: str) -> list[WordInfo]:
+        if not words:
+            return []
+
+        (model_tags,), degraded = self._model_tags_chunked([words], self._deadline_at)
+        self.degraded = self.degraded or degraded
+
+        return self._tag_model_output(model_tags)
+
+    def tag_batch(
+        self, titles: list[str], batch_size: int = 256, deadline: float | None = None
+    ) -> TaggedBatch:
+        """Tag many titles with a single pass through the model and return the
+        result as columnar arrays instead of a list of ``WordInfo`` per title.
+
+        Args:
+            titles (list[str]): The titles
+            batch_size (int, optional): Batch size passed to the tagger. Defaults
+            to 256.
+            deadline (float | None, optional): Latency budget in seconds for the whole
+            batch. If the model misses it, the batch is tagged from the hardcoded word
+            lists and marked as degraded. Defaults to None.
+
+        Returns:
+            TaggedBatch: Token offsets, tags, feature flags and title boundaries
+        """
+        deadline_at = None if deadline is None else time.monotonic() + deadline
+
+        return self._tag_batch(titles, batch_size, deadline_at)
+
+    def _tag_batch(
+        self, titles: list[str], batch_size: int, deadline_at: float | None
+    ) -> TaggedBatch:
+        cleaned = [self._limit(self._clean(title)) for title in titles]
+        nonempty = [title for title in cleaned if title]
+        all_model_tags, degraded = self._model_tags_chunked(
+            nonempty, deadline_at, batch_size
+        )
+        all_model_tags_iter = iter(all_model_tags)
+
+        starts: list[int] = []
+        ends: list[int] = []
+        tags: list[str] = []
+        flags: list[int] = []
+        title_bounds = [0]
+        offset = 0
+        # The features of a word that do not depend on its tag or position are
+        # computed once per distinct word in the batch
+        word_features: dict[str, tuple[int, bool]] = {}
+        for title in cleaned:
+            if title:
+                model_tags = next(all_model_tags_iter)
+                start = offset
+                last_idx = len(model_tags) - 1
+                previous_ends_clause = False
+                for idx, (word, tag) in enumerate(model_tags):
+                    features = word_features.get(word)
+                    if features is None:
+                        features = word_features[word] = self._word_features(word)
+                    word_flags, word_ends_clause = features
+
+                    if tag == "CC":
+                        word_flags |= WordFlag.COORDINATING_CONJUNCTION
+                    if tag == "IN" and not word_flags & WordFlag.PREPOSITION:
+                        word_flags |= WordFlag.SUBORDINATING_CONJUNCTION
+                    if self.is_proper(tag):
+                        word_flags |= WordFlag.PROPER
+                    if idx == 0:
+                        word_flags |= WordFlag.FIRST_WORD
+                    elif previous_ends_clause:
+                        word_flags |= WordFlag.AFTER_PUNCTUATION
+                    if idx == last_idx:
+                        word_flags |= WordFlag.LAST_WORD
+                    previous_ends_clause = word_ends_clause
+
+                    end = start + len(word)
+                    starts.append(start)
+                    ends.append(end)
+                    tags.append(tag)
+                    flags.append(word_flags)
+                    start = end + 1
+
+            offset += len(title) + 1  # titles are joined with a single space
+            title_bounds.append(len(tags))
+
+        return TaggedBatch(
+            text=" ".join(cleaned),
+            starts=np.array(starts, dtype=np.int64),
+            ends=np.array(ends, dtype=np.int64),
+            tags=tags,
+            flags=np.array(flags, dtype=np.uint16),
+            title_bounds=np.array(title_bounds, dtype=np.int64),
+            degraded=degraded,
+        )
+
+
+class WordDecision(typing.NamedTuple):
+    """The casing of a word that only depends on the word itself, for each context
+    that can change it.
+    """
+
+    inner: str  # inside the title
+    inner_coordinating: str  # inside the title, tagged as a coordinating conjunction
+    edge: str  # first or last word, or after punctuation
+
+
+class DecisionTable:
+    """Casing decisions for words whose casing does not depend on their neighbours,
+    i.e. every word that is not hyphenated. Seeded with the lexicon. Other words are
+    admitted on their ``admit_after``-th lookup, up to ``max_size`` of them. The
+    lookup counts of words not admitted yet are cleared when they reach
+    ``4 * max_size`` words, so they stay bounded too.
+
+    Tables are shared by all threads and not locked. Concurrent lookups may lose a
+    count or admit a word twice, so the statistics and limits are approximate, but
+    they never fail.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DECISION_TABLE_MAX_SIZE,
+        admit_after: int = DECISION_TABLE_ADMIT_AFTER,
+    ) -> None:
+        self.decisions: dict[str, WordDecision] = {}
+        self.max_size = max_size
+        self.admit_after = admit_after
+        self.admitted = 0
+        self.hits = 0
+        self.misses = 0
+        self._candidates: collections.Counter[str] = collections.Counter()
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def admit(self, word: str) -> bool:
+        """Count a missed lookup of a word and tell whether to add it to the table."""
+        if self.admitted >= self.max_size:
+            return False
+
+        count = self._candidates[word] + 1
+        if count >= self.admit_after:
+            # Another thread may have dropped the count already
+            self._candidates.pop(word, None)
+            self.admitted += 1
+
+            return True
+
+        if len(self._candidates) >= 4 * self.max_size:
+            self._candidates.clear()
+        self._candidates[word] = count
+
+        return False
+
+
+DecisionTableKey = tuple[frozenset[str], frozenset[tuple[str, str]]]
+
+# The tables of the most recently used (acronyms, special) configurations, keyed by
+# their contents, so stylers given equal sets share a table and a set that is
+# modified gets a new one
+_DECISION_TABLES: collections.OrderedDict[DecisionTableKey, DecisionTable] = (
+    collections.OrderedDict()
+)
+_DECISION_TABLES_LOCK = threading.Lock()
+
+# The configuration of the last lookup, with its key and table. Stylers mostly share
+# the same set and dict, which can then be compared with the key without hashing.
+_LAST_DECISION_TABLE: (
+    tuple[set[str], dict[str, str], DecisionTableKey, DecisionTable] | None
+) = None
+
+
+def clear_decision_tables() -> None:
+    """Drop all decision tables."""
+    global _LAST_DECISION_TABLE
+
+    with _DECISION_TABLES_LOCK:
+        _DECISION_TABLES.clear()
+        _LAST_DECISION_TABLE = None
+
 
 class ChicagoStyler(Styler):
     def __init__(
         self,
-        title: str,
+        title: str = "",
         acronyms: set[str] = ACRONYMS,
         special: dict[str, str] = SPECIAL,
+        deadline: float | None = None,
+        max_chars: int | None = None,
+        max_tokens: int | None = None,
+        overflow: Overflow = Overflow.TRUNCATE,
+        model: SpacyModel = DEFAULT_MODEL,
+        tagger: Tagger | None = None,
     ) -> None:
-        super().__init__(title, acronyms, special)
+        super().__init__(
+            title,
+            acronyms,
+            special,
+            model=model,
+            deadline=deadline,
+            max_chars=max_chars,
+            max_tokens=max_tokens,
+            overflow=overflow,
+            tagger=tagger,
+        )
 
-    def _correct_hyphenated_word(self, word: str) -> str:
+    def _correct_hyphenated_word(
+        self, word: str, tagged_words: list[WordInfo] | None = None
+    ) -> str:
         """
         As per the Chicago style manual:
         1. Always capitalize the first element.
@@ -347,7 +872,8 @@ class ChicagoStyler(Styler):
 
         The 7 musical notes are A, B, C, D, E, F, G
         """
-        tagged_words = self.tag_words(" ".join(word.split("-")))
+        if tagged_words is None:
+            tagged_words = self.tag_words(" ".join(word.split("-")))
         musical_notes = {"a", "b", "c", "d", "e", "f", "g"}
         musical_modifiers = {"sharp", "flat"}
 
@@ -364,67 +890,283 @@ class ChicagoStyler(Styler):
 
             # Since first part is always capitalized, short-circuit
             if idx == 0:
-                corrected.append(w.capitalize())
+                corrected.append(self.capitalize(w))
                 continue
 
-            cw = w.capitalize()
+            cw = self.capitalize(w)
 
-            if w in musical_modifiers and prev_w in musical_notes:
+            # Quotes around the whole word stay attached to its first and last
+            # elements, so look those up without punctuation
+            bare = strip_punctuation(w)
+            prev_bare = strip_punctuation(prev_w)
+
+            if bare in musical_modifiers and prev_bare in musical_notes:
                 cw = w
 
             if (
                 word_info.is_coordinating_conjuction
-                or word_info.is_article
-                or word_info.is_preposition
+                or self.is_article(bare)
+                or self.is_preposition(bare)
             ):
                 cw = w
 
-            if prev.is_prefix:
+            if self.is_prefix(prev_bare):
                 cw = w
 
             if word_info.is_proper:
-                cw = w.capitalize()
+                cw = self.capitalize(w)
 
             corrected.append(cw)
 
         return "-".join(corrected)
 
+    def _hyphen_corrections(
+        self, hyphenated: list[str], deadline_at: float | None
+    ) -> tuple[dict[str, str], bool]:
+        """Tag the elements of all the distinct hyphenated words in one pass instead
+        of running the model once per hyphenated word.
+        """
+        hyphenated = list(dict.fromkeys(hyphenated))
+        if not hyphenated:
+            return {}, False
+
+        elements = [" ".join(w.split("-")) for w in hyphenated]
+        all_model_tags, degraded = self._model_tags(elements, deadline_at)
+        corrections = {
+            w: self._correct_hyphenated_word(w, self._tag_model_output(model_tags))
+            for w, model_tags in zip(hyphenated, all_model_tags)
+        }
+
+        return corrections, degraded
+
+    def _case_word(
+        self, word_info: WordInfo, hyphen_corrections: dict[str, str]
+    ) -> str:
+        """The full chain of rules for one word."""
+        word = word_info.word
+        if (
+            word_info.is_article
+            or word_info.is_coordinating_conjuction
+            or word_info.is_preposition
+        ):
+            correct_word = word.lower()
+        else:
+            correct_word = self.capitalize(word)
+
+        if (
+            word_info.is_first_word
+            or word_info.is_last_word
+            or word_info.is_after_puncutation
+        ):
+            correct_word = self.capitalize(word)
+
+        if word_info.is_first_word_of_paranthetical:
+            correct_word = self.capitalize(word)
+
+        if word_info.is_acronym:
+            correct_word = word.upper()
+
+        if word_info.is_plural_acronym:
+            correct_word = self.uppercase_plural_acronyms(word)
+
+        if word_info.is_hyphenated:
+            correct_word = hyphen_corrections[word]
+
+        return self.replace_special(correct_word)
+
+    def _word_decision(self, word_info: WordInfo) -> WordDecision:
+        """Run the full chain for a word in every context the decision table
+        distinguishes. Only valid for words that are not hyphenated.
+        """
+        inner = dataclasses.replace(
+            word_info,
+            is_after_puncutation=False,
+            is_coordinating_conjuction=False,
+            is_first_word=False,
+            is_last_word=False,
+        )
+
+        return WordDecision(
+            inner=self._case_word(inner, {}),
+            inner_coordinating=self._case_word(
+                dataclasses.replace(inner, is_coordinating_conjuction=True), {}
+            ),
+            edge=self._case_word(dataclasses.replace(inner, is_first_word=True), {}),
+        )
+
+    @property
+    def decision_table(self) -> DecisionTable:
+        """The decision table for this styler's acronyms and special words, built
+        from the lexicon on first use.
+        """
+        global _LAST_DECISION_TABLE
+
+        last = _LAST_DECISION_TABLE
+        if (
+            last is not None
+            and last[0] is self._acronyms
+            and last[1] is self._special
+            and self._acronyms == last[2][0]
+            and self._special.items() == last[2][1]
+        ):
+            return last[3]
+
+        key = (frozenset(self._acronyms), frozenset(self._special.items()))
+        with _DECISION_TABLES_LOCK:
+            if key in _DECISION_TABLES:
+                _DECISION_TABLES.move_to_end(key)
+                table = _DECISION_TABLES[key]
+                _LAST_DECISION_TABLE = (self._acronyms, self._special, key, table)
+
+                return table
+
+        table = DecisionTable()
+        lexicon = itertools.chain(
+            self._acronyms,
+            self._special,
+            ARTICLES,
+            CONJUNCTIONS,
+            PREFIXES,
+            PREPOSITIONS,
+            VALID_TWO_LETTER_WORDS,
+        )
+        for word in lexicon:
+            (word_info,) = self._tag_model_output([(word, "")])
+            if not word_info.is_hyphenated:
+                table.decisions[word] = self._word_decision(word_info)
+
+        with _DECISION_TABLES_LOCK:
+            # Another thread may have built the same table in the meantime
+            table = _DECISION_TABLES.setdefault(key, table)
+            if len(_DECISION_TABLES) > DECISION_TABLES_MAX:
+                _DECISION_TABLES.popitem(last=False)
+            _LAST_DECISION_TABLE = (self._acronyms, self._special, key, table)
+
+        return table
+
     def title_case(self) -> str:
+        hyphen_corrections, degraded = self._hyphen_corrections(
+            [w.word for w in self._tagged_words if w.is_hyphenated], self._deadline_at
+        )
+        self.degraded = self.degraded or degraded
+        if self._deadline_at is not None:
+            DEGRADATION_STATS.record(self.degraded)
+
+        table = self.decision_table
+        decisions = table.decisions
+
         corrected = []
         for word_info in self._tagged_words:
             word = word_info.word
-            if (
-                word_info.is_article
-                or word_info.is_coordinating_conjuction
-                or word_info.is_preposition
-            ):
-                correct_word = word.lower()
+            decision = None if word_info.is_hyphenated else decisions.get(word)
+            if decision is not None:
+                table.hits += 1
             else:
-                correct_word = word.capitalize()
-
-            if (
+                # Hyphenated words depend on the tags of their elements, so they
+                # always go through the full chain
+                table.misses += 1
+                if not word_info.is_hyphenated and table.admit(word):
+                    decision = decisions[word] = self._word_decision(word_info)
+
+            if decision is None:
+                correct_word = self._case_word(word_info, hyphen_corrections)
+            elif (
                 word_info.is_first_word
                 or word_info.is_last_word
                 or word_info.is_after_puncutation
             ):
-                correct_word = word.capitalize()
+                correct_word = decision.edge
+            elif word_info.is_coordinating_conjuction:
+                correct_word = decision.inner_coordinating
+            else:
+                correct_word = decision.inner
 
-            if word_info.is_first_word_of_paranthetical:
-                correct_word = self.capitalize(word)
+            corrected.append(correct_word)
 
-            if word_info.is_acronym:
-                correct_word = word.upper()
+        return " ".join(corrected)
 
-            if word_info.is_plural_acronym:
-                correct_word = self.uppercase_plural_acronyms(word)
+    @staticmethod
+    def casing_decisions(batch: TaggedBatch) -> np.ndarray:
+        """Evaluate the rules of ``title_case`` over a whole batch at once. Later
+        assignments take precedence, mirroring the order of the checks in
+        ``title_case``.
 
-            if word_info.is_hyphenated:
-                correct_word = self._correct_hyphenated_word(word)
+        Args:
+            batch (TaggedBatch): Output of ``tag_batch``
 
-            correct_word = self.replace_special(correct_word)
-            corrected.append(correct_word)
+        Returns:
+            np.ndarray: A ``Casing`` value per token
+        """
+        minor_word = batch.has(
+            WordFlag.ARTICLE | WordFlag.COORDINATING_CONJUNCTION | WordFlag.PREPOSITION
+        )
+        at_boundary = batch.has(
+            WordFlag.FIRST_WORD | WordFlag.LAST_WORD | WordFlag.AFTER_PUNCTUATION
+        )
 
-        return " ".join(corrected)
+        casing = np.where(minor_word, Casing.LOWER, Casing.CAPITALIZE).astype(np.uint8)
+        casing[at_boundary] = Casing.CAPITALIZE
+        casing[batch.has(WordFlag.FIRST_WORD_OF_PARANTHETICAL)] = (
+            Casing.CAPITALIZE_IGNORE_PUNCTUATION
+        )
+        casing[batch.has(WordFlag.ACRONYM)] = Casing.UPPER
+        casing[batch.has(WordFlag.PLURAL_ACRONYM)] = Casing.PLURAL_ACRONYM
+        casing[batch.has(WordFlag.HYPHENATED)] = Casing.HYPHENATED
+
+        return casing
+
+    def title_case_batch(
+        self, titles: list[str] | TaggedBatch, deadline: float | None = None
+    ) -> list[str]:
+        """Title case many titles. Tagging happens once for the whole batch, the
+        rules are evaluated as array operations and only the final string assembly
+        is done per word. Afterwards, ``degraded`` says whether this batch missed its
+        deadline.
+
+        Args:
+            titles (list[str] | TaggedBatch): The titles, or an already tagged batch
+            deadline (float | None, optional): Latency budget in seconds for the whole
+            batch. Defaults to None.
+
+        Returns:
+            list[str]: The title cased titles, in the same order
+        """
+        deadline_at = None if deadline is None else time.monotonic() + deadline
+        if isinstance(titles, TaggedBatch):
+            batch = titles
+        else:
+            batch = self._tag_batch(titles, 256, deadline_at)
+
+        casing = self.casing_decisions(batch)
+
+        words = batch.words()
+        casing_lst = casing.tolist()
+
+        hyphen_corrections, degraded = self._hyphen_corrections(
+            [w for c, w in zip(casing_lst, words) if c == Casing.HYPHENATED],
+            deadline_at,
+        )
+        self.degraded = batch.degraded or degraded
+        if deadline_at is not None:
+            DEGRADATION_STATS.record(self.degraded)
+
+        # Indexed by Casing value
+        funcs = [
+            str.lower,
+            self.capitalize,
+            self.capitalize,
+            str.upper,
+            self.uppercase_plural_acronyms,
+            hyphen_corrections.__getitem__,
+        ]
+        corrected = [
+            self.replace_special(funcs[c](word)) for c, word in zip(casing_lst, words)
+        ]
+        bounds = batch.title_bounds.tolist()
+
+        return [
+            " ".join(corrected[start:end]) for start, end in zip(bounds, bounds[1:])
+        ]
 
     # Capitalize the first word of the title/heading and of any subtitle/subheading
     # Capitalize all major words (nouns, verbs including phrasal verbs such as “play with”, adjectives, adverbs, and pronouns) in the title/heading, including the second part of hyphenated major words (e.g., Self-Report not Self-report)
@@ -0,0 +1,168 @@
+# Imports
+
+import enum
+import os
+import typing
+import warnings
+
+import spacy
+
+from .hardcoded_words import CONJUNCTIONS, PREPOSITIONS
+
+# Types
+
+TaggedText = list[tuple[str, str]]
+
+
+class SpacyModel(enum.StrEnum):
+    LG = "en_core_web_lg"
+    SM = "en_core_web_sm"
+    MD = "en_core_web_md"
+    TRF = "en_core_web_trf"
+
+
+DEFAULT_MODEL = SpacyModel.LG
+
+
+def __getattr__(name: str) -> typing.Any:
+    # DEFAULT_SPACY_MODEL used to be the default model itself, loaded at import
+    if name == "DEFAULT_SPACY_MODEL":
+        warnings.warn(
+            "DEFAULT_SPACY_MODEL is deprecated, use LOADER.load(DEFAULT_MODEL)"
+            " for the loaded model, or DEFAULT_MODEL for its name",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+
+        return LOADER.load(DEFAULT_MODEL)
+
+    raise AttributeError(name)
+
+
+class SpacyModelLoader:
+    def __init__(self) -> None:
+        # Models are loaded on first use, so that importing the package or using
+        # another tagger does not pay for spacy.load
+        self._models: dict[SpacyModel, spacy.Language] = {}
+
+    def load(self, model: SpacyModel):
+        if model not in self._models:
+            nlp = spacy.load(model)
+            self._models[model] = nlp
+
+            return nlp
+
+        return self._models[model]
+
+    def install(self, model: SpacyModel, nlp: spacy.Language) -> None:
+        """Use an already loaded pipeline for ``model``, e.g. one restored from a
+        snapshot.
+        """
+        self._models[model] = nlp
+
+
+LOADER = SpacyModelLoader()
+
+
+class WhitespaceTokenizer(object):
+    """By default, spacy splits on things other than the whitespace, including dashes,
+    and so on. We want to split ONLY on the whitespace.
+    """
+
+    def __init__(self, vocab: spacy.vocab.Vocab) -> None:
+        self.vocab = vocab
+
+    def __call__(self, text: str):
+        words = text.split(" ")
+        # All tokens "own" a subsequent space character in this tokenizer
+        spaces = [True] * len(words)
+
+        return spacy.tokens.Doc(self.vocab, words=words, spaces=spaces)
+
+
+class Tagger(typing.Protocol):
+    """Assigns Penn Treebank tags to cleaned titles. Each text is a string of words
+    separated by single spaces and must come back as one (word, tag) pair per word,
+    in order. Only "CC", "IN", "NNP" and "NNPS" are consulted by the stylers.
+    """
+
+    def tag(self, texts: list[str], batch_size: int = 256) -> list[TaggedText]: ...
+
+
+class SpacyTagger:
+    def __init__(self, model: SpacyModel = DEFAULT_MODEL) -> None:
+        self.nlp = LOADER.load(model)
+        self.nlp.tokenizer = WhitespaceTokenizer(self.nlp.vocab)
+
+    @classmethod
+    def from_nlp(cls, nlp: spacy.Language) -> "SpacyTagger":
+        """Wrap an already loaded pipeline instead of one from LOADER."""
+        tagger = cls.__new__(cls)
+        tagger.nlp = nlp
+        tagger.nlp.tokenizer = WhitespaceTokenizer(nlp.vocab)
+
+        return tagger
+
+    def tag(self, texts: list[str], batch_size: int = 256) -> list[TaggedText]:
+        return [
+            [(token.text, token.tag_) for token in doc]
+            for doc in self.nlp.pipe(texts, batch_size=batch_size)
+        ]
+
+
+class NLTKTagger:
+    """NLTK's averaged perceptron tagger. It produces the same Penn Treebank tag set
+    as the spaCy English models at a fraction of the size and load time.
+
+    The model is only read from local NLTK data and is never downloaded. Install it
+    ahead of time, e.g. ``python -m nltk.downloader averaged_perceptron_tagger_eng``.
+    """
+
+    def __init__(self, loc: str | os.PathLike | None = None) -> None:
+        """
+        Args:
+            loc (str | os.PathLike | None, optional): Directory holding the tagger
+            data. Defaults to None, which searches the NLTK data path.
+
+        Raises:
+            LookupError: If the tagger data is not installed
+        """
+        from nltk.tag.perceptron import PerceptronTagger
+
+        if loc is not None:
+            loc = os.path.abspath(loc)
+        self._tagger = PerceptronTagger(load=True, loc=loc)
+
+    def tag(self, texts: list[str], batch_size: int = 256) -> list[TaggedText]:
+        return [self._tagger.tag(text.split(" ")) for text in texts]
+
+
+class LexiconTagger:
+    """A cheap stand-in for a model that only knows the hardcoded word lists."""
+
+    def tag(self, texts: list[str], batch_size: int = 256) -> list[TaggedText]:
+        return [lexicon_tags(text) for text in texts]
+
+
+def lexicon_tags(text: str) -> TaggedText:
+    """Conjunctions are tagged "CC", prepositions "IN", and everything else gets no
+    tag.
+
+    Args:
+        text (str): Cleaned, single-space separated words
+
+    Returns:
+        TaggedText: (word, tag) pairs, like the model output
+    """
+    tags = []
+    for word in text.split(" "):
+        if word in CONJUNCTIONS:
+            tag = "CC"
+        elif word in PREPOSITIONS:
+            tag = "IN"
+        else:
+            tag = ""
+
+        tags.append((word, tag))
+
+    return tags
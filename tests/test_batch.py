@@ -0,0 +1,44 @@
+import numpy as np
+
+from title_caser import ChicagoStyler, WordFlag
+
+from test_hyphen_logic import TITLES
+
+
+def test_batch_matches_per_title():
+    titles = TITLES + ["corporate distress diagnosis: an (fbi) report", "", "  "]
+    expected = [ChicagoStyler(title).title_case() for title in titles]
+
+    assert ChicagoStyler().title_case_batch(titles) == expected
+
+
+def test_tag_batch_columns():
+    batch = ChicagoStyler().tag_batch(["The  FBI files", "", "of mice"])
+
+    assert batch.words() == ["the", "fbi", "files", "of", "mice"]
+    assert batch.title_bounds.tolist() == [0, 3, 3, 5]
+    assert batch.flags.dtype == np.uint16
+    assert batch.has(WordFlag.ACRONYM).tolist() == [False, True, False, False, False]
+    assert batch.has(WordFlag.FIRST_WORD).tolist() == [True, False, False, True, False]
+
+
+def test_batch_flags_match_word_info():
+    titles = TITLES + ["why? a study — of the fbi’s (cia) files…"]
+    styler = ChicagoStyler()
+    batch = styler.tag_batch(titles)
+    bounds = batch.title_bounds.tolist()
+    for j, title in enumerate(titles):
+        (model_tags,), _ = styler._model_tags([styler._clean(title)])
+        for idx, word_info in enumerate(styler._tag_model_output(model_tags)):
+            flags = int(batch.flags[bounds[j] + idx])
+            for flag in WordFlag:
+                field = {
+                    WordFlag.AFTER_PUNCTUATION: "is_after_puncutation",
+                    WordFlag.COORDINATING_CONJUNCTION: "is_coordinating_conjuction",
+                    WordFlag.FIRST_WORD_OF_PARANTHETICAL: (
+                        "is_first_word_of_paranthetical"
+                    ),
+                    WordFlag.SUBORDINATING_CONJUNCTION: "is_subordinating_conjuction",
+                }.get(flag, f"is_{flag.name.lower()}")
+
+                assert bool(flags & flag) == getattr(word_info, field), (title, flag)
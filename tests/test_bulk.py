@@ -0,0 +1,195 @@
+import json
+
+import pytest
+
+from title_caser import ChicagoStyler, LexiconTagger, Overflow
+from title_caser.__main__ import main
+from title_caser.bulk import MANIFEST_NAME, _job_config, plan_shards, run_bulk_job
+
+TITLES = [
+    "corporate distress diagnosis: an integrative framework",
+    "",
+    "record-breaking borrowings from medium-sized libraries",
+    "the fbi files",
+] * 10
+
+
+def test_plan_shards_split_on_lines(tmp_path):
+    path = tmp_path / "titles.txt"
+    path.write_text("\n".join(TITLES))
+    data = path.read_bytes()
+
+    shards = plan_shards(path, 100)
+
+    assert len(shards) > 1
+    assert shards[0].start == 0
+    assert shards[-1].end == len(data)
+    for shard, next_shard in zip(shards, shards[1:]):
+        assert shard.end == next_shard.start
+        assert data[shard.end - 1 : shard.end] == b"\n"
+
+
+def test_run_bulk_job(tmp_path):
+    path = tmp_path / "titles.txt"
+    path.write_text("\n".join(TITLES) + "\n")
+    output = tmp_path / "cased.txt"
+
+    result = run_bulk_job(path, output, workers=1, shard_size=200)
+
+    assert result.lines == len(TITLES)
+    assert output.read_text().split("\n")[:-1] == ChicagoStyler().title_case_batch(
+        TITLES
+    )
+    assert not (tmp_path / "cased.txt.parts").exists()
+
+
+def test_resume_skips_finished_shards(tmp_path):
+    path = tmp_path / "titles.txt"
+    path.write_text("\n".join(TITLES) + "\n")
+    output = tmp_path / "cased.txt"
+    workdir = tmp_path / "work"
+    workdir.mkdir()
+
+    # Simulate an interrupted run that finished only the first shard
+    shards = plan_shards(path, 200)
+    stat = path.stat()
+    shards[0].done = True
+    shards[0].lines = 1
+    (workdir / shards[0].filename).write_text("SENTINEL\n")
+    manifest = {
+        "input": str(path.resolve()),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "config": _job_config(200, {}),
+        "shards": [vars(shard) for shard in shards],
+    }
+    (workdir / MANIFEST_NAME).write_text(json.dumps(manifest))
+
+    run_bulk_job(path, output, workdir=workdir, workers=1, shard_size=200)
+
+    first_shard_lines = path.read_bytes()[: shards[0].end].count(b"\n")
+    cased = ChicagoStyler().title_case_batch(TITLES)
+    assert (
+        output.read_text().split("\n")[:-1] == ["SENTINEL"] + cased[first_shard_lines:]
+    )
+
+
+def test_plan_shards_rejects_bad_size(tmp_path):
+    path = tmp_path / "titles.txt"
+    path.write_text("\n".join(TITLES))
+
+    with pytest.raises(ValueError):
+        plan_shards(path, 0)
+
+
+def test_resume_with_other_settings_fails(tmp_path):
+    path = tmp_path / "titles.txt"
+    path.write_text("\n".join(TITLES) + "\n")
+    workdir = tmp_path / "work"
+    workdir.mkdir()
+    stat = path.stat()
+    manifest = {
+        "input": str(path.resolve()),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "config": _job_config(200, {"acronyms": {"fbi"}}),
+        "shards": [vars(shard) for shard in plan_shards(path, 200)],
+    }
+    (workdir / MANIFEST_NAME).write_text(json.dumps(manifest))
+
+    with pytest.raises(ValueError):
+        run_bulk_job(path, tmp_path / "cased.txt", workdir=workdir, shard_size=200)
+
+    # The same settings, however the set is ordered, resume fine
+    run_bulk_job(
+        path,
+        tmp_path / "cased.txt",
+        workdir=workdir,
+        workers=1,
+        shard_size=200,
+        acronyms={"fbi"},
+    )
+
+
+def test_rejected_lines_are_recorded(tmp_path):
+    long_title = " ".join(["investment"] * 20)
+    path = tmp_path / "titles.txt"
+    path.write_text(f"the fbi files\n{long_title}\nof mice\n")
+    output = tmp_path / "cased.txt"
+
+    result = run_bulk_job(
+        path, output, workers=1, max_tokens=10, overflow=Overflow.REJECT
+    )
+
+    assert output.read_text().split("\n")[:-1] == [
+        "The FBI Files",
+        long_title,
+        "Of Mice",
+    ]
+    assert result.lines == 3
+    assert result.rejected == [len("the fbi files\n")]
+
+
+def test_undecodable_lines_are_recorded(tmp_path):
+    path = tmp_path / "titles.txt"
+    path.write_bytes(b"the fbi files\nbad \xff title\nof mice\n")
+    output = tmp_path / "cased.txt"
+
+    result = run_bulk_job(path, output, workers=1, tagger=LexiconTagger())
+
+    assert output.read_bytes() == b"The FBI Files\nbad \xff title\nOf Mice\n"
+    assert result.rejected == [len("the fbi files\n")]
+
+
+class FailingTagger(LexiconTagger):
+    def tag(self, texts, batch_size=256):
+        if any("boom" in text for text in texts):
+            raise RuntimeError("boom")
+
+        return super().tag(texts, batch_size)
+
+
+def test_finished_shards_recorded_when_one_fails(tmp_path):
+    path = tmp_path / "titles.txt"
+    path.write_text("\n".join(["the fbi files"] * 20 + ["boom"]) + "\n")
+    workdir = tmp_path / "work"
+
+    with pytest.raises(RuntimeError):
+        run_bulk_job(
+            path,
+            tmp_path / "cased.txt",
+            workdir=workdir,
+            workers=2,
+            shard_size=20,
+            tagger=FailingTagger(),
+        )
+
+    shards = json.loads((workdir / MANIFEST_NAME).read_text())["shards"]
+    assert not shards[-1]["done"]
+    for shard in shards:
+        assert shard["done"] == (workdir / f"shard-{shard['index']:05d}.txt").exists()
+
+
+def test_bulk_cli(tmp_path, capsys):
+    long_title = " ".join(["investment"] * 20)
+    path = tmp_path / "titles.txt"
+    path.write_text(f"the fbi files\n{long_title}\n")
+    acronyms = tmp_path / "acronyms.txt"
+    acronyms.write_text("xyzq\n")
+    output = tmp_path / "cased.txt"
+
+    main(
+        [
+            "bulk",
+            str(path),
+            str(output),
+            "--workers=1",
+            "--tagger=lexicon",
+            f"--acronyms={acronyms}",
+            "--max-tokens=10",
+            "--overflow=reject",
+        ]
+    )
+
+    assert output.read_text() == f"The FBI Files\n{long_title}\n"
+    assert "1 rejected" in capsys.readouterr().out
@@ -0,0 +1,91 @@
+import pytest
+
+from title_caser import ChicagoStyler, LexiconTagger
+from title_caser.charclass import (
+    ends_clause,
+    is_latin,
+    leading_punctuation_length,
+    rstrip_punctuation,
+    strip_diacritics,
+    strip_punctuation,
+)
+
+
+@pytest.mark.parametrize(
+    "word, expected",
+    [
+        ("(the", "(The"),
+        ("“the", "“The"),
+        ("«la", "«La"),
+        ("¿qué", "¿Qué"),
+        ("---", "---"),
+        ("", ""),
+    ],
+)
+def test_capitalize(word: str, expected: str):
+    assert ChicagoStyler.capitalize(word) == expected
+
+
+def test_punctuation():
+    assert strip_punctuation("(k&r),") == "kr"
+    assert strip_punctuation("“fbi”") == "fbi"
+    assert rstrip_punctuation("cdcs”!") == "cdcs"
+    assert leading_punctuation_length("‘(“x") == 3
+    assert ends_clause("aid:")
+    assert ends_clause("—")
+    assert ends_clause("why?”")
+    assert ends_clause('why?"')
+    assert ends_clause("why?'")
+    assert not ends_clause("sentinel")
+    assert not ends_clause("")
+
+
+def test_unicode_titles():
+    assert (
+        ChicagoStyler("foreign aid — a reassessment").title_case()
+        == "Foreign Aid — A Reassessment"
+    )
+    assert ChicagoStyler("“the fbi” -- of mice").title_case() == "“The FBI” -- Of Mice"
+
+
+def test_ascii_and_curly_quotes_agree():
+    assert ChicagoStyler('"why?" a study').title_case() == '"Why?" A Study'
+    assert ChicagoStyler("“why?” a study").title_case() == "“Why?” A Study"
+
+
+def test_letter_classes():
+    assert is_latin("crwth")
+    assert is_latin("résumé")
+    assert is_latin("“fbi”")
+    assert not is_latin("москва")
+    assert not is_latin("λόγος")
+    assert strip_diacritics("été") == "ete"
+
+
+@pytest.mark.parametrize(
+    "title, expected",
+    [
+        ("москва и петербург", "Москва И Петербург"),
+        ("λόγος", "Λόγος"),
+        ("été", "Été"),
+        ("the cwm and the fbi", "The Cwm and the FBI"),
+    ],
+)
+def test_non_latin_words_are_not_acronyms(title: str, expected: str):
+    assert ChicagoStyler(title, tagger=LexiconTagger()).title_case() == expected
+
+
+@pytest.mark.parametrize(
+    "title, expected",
+    [
+        ("“self-made” men", "“Self-Made” Men"),
+        ("the “e-mail” problem", "The “E-mail” Problem"),
+        ("a “built-in” flaw", "A “Built-in” Flaw"),
+        ("the “iphone” era", "The “iPhone” Era"),
+    ],
+)
+def test_quoted_hyphenated_words(title: str, expected: str):
+    styler = ChicagoStyler(title, tagger=LexiconTagger())
+
+    assert styler.title_case() == expected
+    assert styler.title_case_batch([title]) == [expected]
@@ -0,0 +1,66 @@
+import time
+
+from title_caser import DEGRADATION_STATS, ChicagoStyler, LexiconTagger
+
+
+def test_no_deadline_is_not_degraded():
+    styler = ChicagoStyler("insert knob a in hole b")
+    styler.title_case()
+
+    assert not styler.degraded
+
+
+def test_missed_deadline_falls_back_to_lexicon():
+    DEGRADATION_STATS.reset()
+    styler = ChicagoStyler("the fbi and the cia: a history", deadline=0)
+
+    assert styler.degraded
+    assert styler.title_case() == "The FBI and the CIA: A History"
+    assert DEGRADATION_STATS.degraded >= 1
+    assert DEGRADATION_STATS.degraded == DEGRADATION_STATS.calls
+
+
+def test_batch_deadline():
+    styler = ChicagoStyler()
+    titles = ["the fbi and the cia", "out-of-fashion initiatives"]
+
+    assert styler.title_case_batch(titles, deadline=0) == [
+        "The FBI and the CIA",
+        "Out-of-Fashion Initiatives",
+    ]
+    assert styler.degraded
+
+    styler.title_case_batch(titles, deadline=60)
+    assert not styler.degraded
+
+
+class SlowTagger:
+    def tag(self, texts, batch_size=256):
+        time.sleep(0.5)
+
+        return LexiconTagger().tag(texts)
+
+
+class QuickTagger:
+    def tag(self, texts, batch_size=256):
+        return LexiconTagger().tag(texts)
+
+
+def test_abandoned_call_does_not_block_others():
+    assert ChicagoStyler("a slow title", tagger=SlowTagger(), deadline=0.05).degraded
+
+    start = time.monotonic()
+    styler = ChicagoStyler("the fbi files", tagger=QuickTagger(), deadline=0.2)
+    assert not styler.degraded
+    styler = ChicagoStyler("the fbi files", tagger=LexiconTagger(), deadline=0.2)
+    assert not styler.degraded
+    assert time.monotonic() - start < 0.2
+
+
+def test_stats_count_titles():
+    DEGRADATION_STATS.reset()
+    ChicagoStyler("out-of-fashion initiatives", deadline=0).title_case()
+    ChicagoStyler().title_case_batch(["out-of-fashion", "the fbi"], deadline=0)
+    ChicagoStyler("no deadline").title_case()
+
+    assert (DEGRADATION_STATS.calls, DEGRADATION_STATS.degraded) == (2, 2)
@@ -0,0 +1,105 @@
+import concurrent.futures
+import sys
+
+from test_hyphen_logic import TITLES
+
+from title_caser import ACRONYMS, ChicagoStyler, clear_decision_tables
+from title_caser.styler import _DECISION_TABLES, DECISION_TABLES_MAX, DecisionTable
+
+
+def test_table_is_seeded_from_lexicon():
+    table = ChicagoStyler().decision_table
+
+    assert table.decisions["fbi"].inner == "FBI"
+    assert table.decisions["of"].inner == "of"
+    assert table.decisions["of"].edge == "Of"
+    assert table.decisions["iphone"].inner == "iPhone"
+    assert "e-mail" not in table.decisions  # hyphenated words are never cached
+
+
+def test_table_per_configuration():
+    acronyms = ACRONYMS | {"xyzq"}
+
+    assert ChicagoStyler("the xyzq files", acronyms=acronyms).title_case() == (
+        "The XYZQ Files"
+    )
+    assert ChicagoStyler("the xyzq files").title_case() == "The Xyzq Files"
+    assert (
+        ChicagoStyler(acronyms=acronyms).decision_table
+        is not ChicagoStyler().decision_table
+    )
+
+
+def test_table_matches_full_chain():
+    clear_decision_tables()
+    # Words are admitted on their third lookup, so this covers both paths
+    for title in TITLES * 3:
+        styler = ChicagoStyler(title)
+        hyphen_corrections, _ = styler._hyphen_corrections(
+            [w.word for w in styler._tagged_words if w.is_hyphenated], None
+        )
+        expected = " ".join(
+            styler._case_word(word_info, hyphen_corrections)
+            for word_info in styler._tagged_words
+        )
+
+        assert styler.title_case() == expected
+
+    table = ChicagoStyler().decision_table
+    table.hits = table.misses = 0
+    ChicagoStyler("Cross-Stitching for Beginners").title_case()
+    assert (table.hits, table.misses) == (2, 1)
+
+
+def test_table_keyed_by_content():
+    acronyms = set(ACRONYMS)
+
+    assert ChicagoStyler(acronyms=acronyms).decision_table is (
+        ChicagoStyler().decision_table
+    )
+    assert ChicagoStyler("the xyzq files", acronyms=acronyms).title_case() == (
+        "The Xyzq Files"
+    )
+
+    # A modified set gets its own table
+    acronyms.add("xyzq")
+    assert ChicagoStyler("the xyzq files", acronyms=acronyms).title_case() == (
+        "The XYZQ Files"
+    )
+
+
+def test_tables_are_bounded():
+    for i in range(DECISION_TABLES_MAX + 2):
+        ChicagoStyler(acronyms=ACRONYMS | {f"xyz{i}"}).decision_table
+
+    assert len(_DECISION_TABLES) == DECISION_TABLES_MAX
+
+
+def test_words_admitted_after_repeated_misses():
+    table = DecisionTable(max_size=1, admit_after=3)
+
+    assert [table.admit("aardvark") for _ in range(3)] == [False, False, True]
+    # Full
+    assert [table.admit("zebra") for _ in range(3)] == [False, False, False]
+
+
+def test_admit_from_many_threads():
+    # Never full, so every other lookup of a word admits it and drops its count
+    table = DecisionTable(max_size=sys.maxsize, admit_after=2)
+    words = ["aardvark", "zebra"]
+
+    def admit_all() -> None:
+        for _ in range(50_000):
+            for word in words:
+                table.admit(word)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            for future in [executor.submit(admit_all) for _ in range(8)]:
+                future.result()
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert table.admitted >= len(words)
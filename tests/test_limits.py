@@ -0,0 +1,57 @@
+import pytest
+
+from title_caser import ChicagoStyler, LexiconTagger, Overflow, TitleTooLongError
+
+LONG_TITLE = " ".join(["investment equations of the fbi"] * 50)
+
+
+def test_truncate():
+    assert (
+        ChicagoStyler(LONG_TITLE, max_tokens=6).title_case()
+        == "Investment Equations of the FBI Investment"
+    )
+    assert (
+        ChicagoStyler(LONG_TITLE, max_chars=25).title_case()
+        == "Investment Equations Of"
+    )
+    assert ChicagoStyler("antidisestablishment", max_chars=4).title_case() == "Anti"
+
+
+def test_reject():
+    with pytest.raises(TitleTooLongError):
+        ChicagoStyler(LONG_TITLE, max_tokens=100, overflow=Overflow.REJECT)
+
+    ChicagoStyler("short title", max_tokens=100, overflow=Overflow.REJECT)
+
+
+def test_chunk_keeps_every_word():
+    styler = ChicagoStyler(LONG_TITLE, max_tokens=7, overflow="chunk")
+    cased = styler.title_case()
+
+    assert len(cased.split(" ")) == 250
+    assert cased.startswith("Investment Equations of the FBI Investment")
+    assert cased.endswith("of the FBI")
+    assert ChicagoStyler(max_tokens=7, overflow=Overflow.CHUNK).title_case_batch(
+        [LONG_TITLE, "of mice"]
+    ) == [cased, "Of Mice"]
+
+
+def test_chunk_cuts_long_words_for_the_model():
+    seen = []
+
+    class RecordingTagger(LexiconTagger):
+        def tag(self, texts, batch_size=256):
+            seen.extend(texts)
+
+            return super().tag(texts, batch_size)
+
+    word = "antidisestablishmentarianism"
+    styler = ChicagoStyler(
+        f"the {word} of the fbi",
+        max_chars=10,
+        overflow=Overflow.CHUNK,
+        tagger=RecordingTagger(),
+    )
+
+    assert styler.title_case() == f"The {word.capitalize()} of the FBI"
+    assert max(len(text) for text in seen) <= 10
@@ -0,0 +1,38 @@
+import gc
+import os
+
+from title_caser import ChicagoStyler
+from title_caser.prefork import preload, reinit_after_fork
+
+
+def test_preload_freezes():
+    try:
+        (tagger,) = preload()
+        assert gc.get_freeze_count() > 0
+        assert not gc.isenabled()
+        assert ChicagoStyler("bread and butter", tagger=tagger).title_case()
+
+        pid = os.fork()
+        if pid == 0:
+            os._exit(int(not gc.isenabled()))
+
+        _, status = os.waitpid(pid, 0)
+        assert os.waitstatus_to_exitcode(status) == 0
+    finally:
+        gc.unfreeze()
+        reinit_after_fork()
+
+    assert gc.isenabled()
+
+
+def test_deadline_works_in_forked_child():
+    # Starts the executor thread in the parent, which the child does not inherit
+    assert not ChicagoStyler("the fbi files", deadline=60).degraded
+
+    pid = os.fork()
+    if pid == 0:
+        degraded = ChicagoStyler("the fbi files", deadline=60).degraded
+        os._exit(int(degraded))
+
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
@@ -0,0 +1,75 @@
+import time
+
+import pytest
+
+from title_caser import LexiconTagger
+from title_caser.__main__ import main
+from title_caser.profiling import ProfileMode, profile_titles
+
+TITLES = [
+    "corporate distress diagnosis: an integrative framework",
+    "record-breaking borrowings from medium-sized libraries",
+    "",
+] * 5
+
+
+def test_deterministic_profile(tmp_path):
+    report = profile_titles(TITLES, mode=ProfileMode.DETERMINISTIC)
+    functions = [hotspot.function for hotspot in report.hotspots()]
+
+    assert report.titles == len(TITLES)
+    assert "styler.py:Styler.tag_words" in functions
+    assert "styler.py:ChicagoStyler._correct_hyphenated_word" in functions
+    assert "tagger" in report.pipe_seconds
+    assert "tag_words" in report.format(limit=len(functions))
+
+    path = tmp_path / "stacks.folded"
+    report.write_collapsed(path)
+    for line in path.read_text().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert stack and int(count) > 0
+
+
+def test_sampling_profile():
+    report = profile_titles(TITLES, mode="sampling", interval=0.001)
+
+    assert report.mode == ProfileMode.SAMPLING
+    assert all(seconds > 0 for seconds in report.stacks.values())
+
+
+class SlowTagger:
+    def tag(self, texts, batch_size=256):
+        time.sleep(0.01)
+
+        return LexiconTagger().tag(texts)
+
+
+@pytest.mark.parametrize("mode", list(ProfileMode))
+def test_profile_includes_deadline_threads(mode):
+    report = profile_titles(
+        TITLES, mode=mode, interval=0.001, tagger=SlowTagger(), deadline=60
+    )
+    functions = [hotspot.function for hotspot in report.hotspots()]
+
+    assert "styler.py:Styler._run_tagger" in functions
+    assert "test_profiling.py:SlowTagger.tag" in functions
+
+
+def test_profile_cli(tmp_path, capsys):
+    titles = tmp_path / "titles.txt"
+    titles.write_text("\n".join(TITLES))
+    acronyms = tmp_path / "acronyms.txt"
+    acronyms.write_text("xyzq\n")
+
+    main(
+        [
+            "profile",
+            str(titles),
+            "--mode=deterministic",
+            "--tagger=lexicon",
+            f"--acronyms={acronyms}",
+            "--deadline=60",
+        ]
+    )
+
+    assert "titles/s" in capsys.readouterr().out
@@ -0,0 +1,59 @@
+import numpy as np
+import spacy
+from spacy.vectors import Vectors
+
+from title_caser import ACRONYMS, ChicagoStyler
+from title_caser.snapshot import load_snapshot, save_snapshot
+
+TITLES = [
+    "corporate distress diagnosis: comparisons using linear discriminant analysis",
+    "record-breaking borrowings from medium-sized libraries",
+    "the xyzq and the fbi",
+]
+
+
+def test_snapshot_round_trip(tmp_path):
+    path = tmp_path / "styler.snapshot"
+    acronyms = ACRONYMS | {"xyzq"}
+    save_snapshot(path, acronyms=acronyms)
+
+    snapshot = load_snapshot(path)
+
+    assert snapshot.acronyms == acronyms
+    assert snapshot.tagger.nlp.component_names == ["tok2vec", "tagger"]
+    for title in TITLES:
+        assert (
+            snapshot.styler(title).title_case()
+            == ChicagoStyler(title, acronyms=acronyms).title_case()
+        )
+
+
+def test_snapshot_maps_vectors(tmp_path, monkeypatch):
+    nlp = spacy.blank("en")
+    data = np.arange(12, dtype=np.float32).reshape(4, 3)
+    nlp.vocab.vectors = Vectors(
+        strings=nlp.vocab.strings, data=data, keys=["fbi", "cia", "of", "mice"]
+    )
+    monkeypatch.setattr(spacy, "load", lambda model: nlp)
+    path = tmp_path / "styler.snapshot"
+    save_snapshot(path)
+
+    vectors = load_snapshot(path).tagger.nlp.vocab.vectors
+
+    assert isinstance(vectors.data, np.memmap)
+    assert np.array_equal(vectors.data, data)
+    assert np.array_equal(vectors["cia"], data[1])
+
+
+def test_snapshot_drops_disabled_components(tmp_path, monkeypatch):
+    nlp = spacy.blank("en")
+    nlp.add_pipe("tagger").add_label("NN")
+    nlp.add_pipe("senter")
+    nlp.add_pipe("sentencizer")
+    nlp.initialize()
+    nlp.disable_pipe("senter")
+    monkeypatch.setattr(spacy, "load", lambda model: nlp)
+    path = tmp_path / "styler.snapshot"
+    save_snapshot(path)
+
+    assert load_snapshot(path).tagger.nlp.component_names == ["tagger"]
@@ -0,0 +1,49 @@
+import pytest
+
+from title_caser import DEFAULT_MODEL, LOADER, ChicagoStyler, LexiconTagger, NLTKTagger
+
+
+def test_lexicon_tagger():
+    assert LexiconTagger().tag(["bread and butter", "of mice"]) == [
+        [("bread", ""), ("and", "CC"), ("butter", "")],
+        [("of", "IN"), ("mice", "")],
+    ]
+    assert (
+        ChicagoStyler("the fbi and the cia", tagger=LexiconTagger()).title_case()
+        == "The FBI and the CIA"
+    )
+
+
+def test_nltk_tagger():
+    pytest.importorskip("nltk")
+    try:
+        tagger = NLTKTagger()
+    except LookupError:
+        pytest.skip("NLTK averaged perceptron tagger data is not installed")
+
+    (tagged,) = tagger.tag(["bank shocks and investment in new york"])
+
+    assert [word for word, _ in tagged] == [
+        "bank",
+        "shocks",
+        "and",
+        "investment",
+        "in",
+        "new",
+        "york",
+    ]
+    assert dict(tagged)["and"] == "CC"
+    assert dict(tagged)["in"] == "IN"
+    assert (
+        ChicagoStyler("bread and butter in new york", tagger=tagger).title_case()
+        == "Bread and Butter in New York"
+    )
+
+
+def test_default_spacy_model_is_deprecated():
+    import title_caser
+
+    with pytest.deprecated_call():
+        nlp = title_caser.DEFAULT_SPACY_MODEL
+
+    assert nlp is LOADER.load(DEFAULT_MODEL)